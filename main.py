@@ -9,18 +9,23 @@ A complete Monopoly game implementation following Tiger Style principles:
 """
 
 import random
+import re
 import sys
+import time
+from collections import Counter
 from dataclasses import dataclass, field
-from enum import Enum, auto
-from typing import Dict, List, Optional, Tuple
+from enum import IntEnum, auto
+from typing import Callable, Dict, List, Optional, Tuple
 
-from rich.console import Console
+from rich.console import Console, Group
+from rich.highlighter import ReprHighlighter
 from rich.panel import Panel
 from rich.prompt import Prompt
 from rich.table import Table
+from rich.text import Text
 
 
-class PropertyColor(Enum):
+class PropertyColor(IntEnum):
     BROWN = auto()
     LIGHT_BLUE = auto()
     PINK = auto()
@@ -33,7 +38,7 @@ class PropertyColor(Enum):
     UTILITY = auto()
 
 
-class SpaceType(Enum):
+class SpaceType(IntEnum):
     PROPERTY = auto()
     RAILROAD = auto()
     UTILITY = auto()
@@ -46,7 +51,360 @@ class SpaceType(Enum):
     FREE_PARKING = auto()
 
 
-@dataclass
+class ChanceCard(IntEnum):
+    ADVANCE_TO_BOARDWALK = 0
+    ADVANCE_TO_GO = auto()
+    ADVANCE_TO_ILLINOIS = auto()
+    ADVANCE_TO_ST_CHARLES = auto()
+    NEAREST_RAILROAD_1 = auto()
+    NEAREST_RAILROAD_2 = auto()
+    NEAREST_UTILITY = auto()
+    BANK_DIVIDEND = auto()
+    GET_OUT_OF_JAIL_FREE = auto()
+    GO_BACK_3 = auto()
+    GO_TO_JAIL = auto()
+    GENERAL_REPAIRS = auto()
+    SPEEDING_FINE = auto()
+    READING_RAILROAD = auto()
+    CHAIRMAN_OF_THE_BOARD = auto()
+    BUILDING_LOAN = auto()
+
+
+class CommunityChestCard(IntEnum):
+    ADVANCE_TO_GO = 0
+    BANK_ERROR = auto()
+    DOCTORS_FEE = auto()
+    STOCK_SALE = auto()
+    GET_OUT_OF_JAIL_FREE = auto()
+    GO_TO_JAIL = auto()
+    HOLIDAY_FUND = auto()
+    INCOME_TAX_REFUND = auto()
+    BIRTHDAY = auto()
+    LIFE_INSURANCE = auto()
+    HOSPITAL_FEES = auto()
+    SCHOOL_FEES = auto()
+    CONSULTANCY_FEE = auto()
+    STREET_REPAIRS = auto()
+    BEAUTY_CONTEST = auto()
+    INHERITANCE = auto()
+
+
+# Card text indexed by card value
+_CHANCE_TEXT: Tuple[str, ...] = (
+    "Advance to Boardwalk",
+    "Advance to Go (Collect $200)",
+    "Advance to Illinois Avenue. If you pass Go, collect $200",
+    "Advance to St. Charles Place. If you pass Go, collect $200",
+    "Advance to the nearest Railroad. If unowned, you may buy it from the Bank. If owned, pay owner twice the rental to which they are otherwise entitled",
+    "Advance to the nearest Railroad. If unowned, you may buy it from the Bank. If owned, pay owner twice the rental to which they are otherwise entitled",
+    "Advance token to nearest Utility. If unowned, you may buy it from the Bank. If owned, throw dice and pay owner a total ten times amount thrown",
+    "Bank pays you dividend of $50",
+    "Get Out of Jail Free",
+    "Go Back 3 Spaces",
+    "Go to Jail. Go directly to Jail, do not pass Go, do not collect $200",
+    "Make general repairs on all your property. For each house pay $25. For each hotel pay $100",
+    "Speeding fine $15",
+    "Take a trip to Reading Railroad. If you pass Go, collect $200",
+    "You have been elected Chairman of the Board. Pay each player $50",
+    "Your building loan matures. Collect $150",
+)
+
+_COMMUNITY_CHEST_TEXT: Tuple[str, ...] = (
+    "Advance to Go (Collect $200)",
+    "Bank error in your favor. Collect $200",
+    "Doctor's fee. Pay $50",
+    "From sale of stock you get $50",
+    "Get Out of Jail Free",
+    "Go to Jail. Go directly to jail, do not pass Go, do not collect $200",
+    "Holiday fund matures. Receive $100",
+    "Income tax refund. Collect $20",
+    "It is your birthday. Collect $10 from every player",
+    "Life insurance matures. Collect $100",
+    "Pay hospital fees of $100",
+    "Pay school fees of $50",
+    "Receive $25 consultancy fee",
+    "You are assessed for street repair. $40 per house. $115 per hotel",
+    "You have won second prize in a beauty contest. Collect $10",
+    "You inherit $100",
+)
+
+# Full decks, sampled into a fresh shuffled list whenever a deck runs out
+_CHANCE_DECK: Tuple[ChanceCard, ...] = tuple(ChanceCard)
+_COMMUNITY_CHEST_DECK: Tuple[CommunityChestCard, ...] = tuple(CommunityChestCard)
+
+
+# Number of properties in each color group needed for a monopoly
+_MONOPOLY_SIZE: Dict[PropertyColor, int] = {
+    PropertyColor.BROWN: 2,
+    PropertyColor.LIGHT_BLUE: 3,
+    PropertyColor.PINK: 3,
+    PropertyColor.ORANGE: 3,
+    PropertyColor.RED: 3,
+    PropertyColor.YELLOW: 3,
+    PropertyColor.GREEN: 3,
+    PropertyColor.DARK_BLUE: 2,
+    PropertyColor.RAILROAD: 4,
+    PropertyColor.UTILITY: 2,
+}
+
+# Human-readable color group names, e.g. "Light Blue"
+_COLOR_DISPLAY: Dict[PropertyColor, str] = {
+    color: color.name.replace("_", " ").title() for color in PropertyColor
+}
+
+# Groups that can never hold houses or hotels
+_NON_BUILDABLE = frozenset({PropertyColor.RAILROAD, PropertyColor.UTILITY})
+
+_MESSAGE_HIGHLIGHTER = ReprHighlighter()
+
+
+def _message(markup: str) -> Text:
+    """Render markup once, highlighted as Console.print would highlight it"""
+    return _MESSAGE_HIGHLIGHTER(Text.from_markup(markup))
+
+
+# Fixed game messages, built once instead of markup-parsed on every print
+_PASSED_GO_MESSAGE = _message("💰 Passed GO! Collect $200")
+_DOUBLES_MESSAGE = _message("🎲 Doubles! You get another turn after this one.")
+_ROLL_AGAIN_MESSAGE = _message("🎲 Rolling again due to doubles!")
+_GO_TO_JAIL_MESSAGE = _message("🚔 Go to Jail!")
+_JAIL_FORCED_FINE_MESSAGE = _message("Must pay $50 to get out!")
+_JAIL_FINE_PAID_MESSAGE = _message("💸 Paid $50 - Released from jail!")
+_JAIL_FINE_UNAFFORDABLE_MESSAGE = _message("❌ Not enough money!")
+_JAIL_CARD_USED_MESSAGE = _message("🃏 Used Get Out of Jail Free card - Released!")
+_CANNOT_AFFORD_PROPERTY_MESSAGE = _message("❌ Cannot afford this property")
+_CANNOT_PAY_RENT_MESSAGE = _message("❌ Not enough money to pay rent!")
+_CANNOT_PAY_TAX_MESSAGE = _message("❌ Not enough money to pay tax!")
+_TRADE_HEADER_MESSAGE = _message("\n[bold]Building Trade Offer[/bold]")
+
+# Comma-separated property numbers entered in the trade menu
+_PROPERTY_LIST_RE = re.compile(r"\s*\d+(?:\s*,\s*\d+)*\s*")
+_NUMBER_RE = re.compile(r"\d+")
+# One line of the trade receipt: item, giver, receiver
+_TRANSFER_LINE = "  {}: {} → {}".format
+
+# One term of a single-line trade offer, e.g. give=1,3 or wantcash=50
+_TRADE_TERM_RE = re.compile(r"(give|cash|want|wantcash)=(\d+(?:,\d+)*)")
+
+# Dice are drawn in batches; random.choices fills the whole batch in C
+_DICE_FACES = range(1, 7)
+_DICE_BATCH_SIZE = 256
+
+# Spaces 1-39 of the USA board, built once at import and shared by all games
+_PROPERTIES_DATA: Tuple[Dict, ...] = (
+    {
+        "name": "Mediterranean Avenue",
+        "type": "property",
+        "color": PropertyColor.BROWN,
+        "price": 60,
+        "rent": (2, 4, 10, 30, 90, 160, 250),
+        "house_cost": 50,
+    },
+    {"name": "Community Chest", "type": "community_chest"},
+    {
+        "name": "Baltic Avenue",
+        "type": "property",
+        "color": PropertyColor.BROWN,
+        "price": 60,
+        "rent": (4, 8, 20, 60, 180, 320, 450),
+        "house_cost": 50,
+    },
+    {"name": "Income Tax", "type": "tax", "amount": 200},
+    {"name": "Reading Railroad", "type": "railroad"},
+    {
+        "name": "Oriental Avenue",
+        "type": "property",
+        "color": PropertyColor.LIGHT_BLUE,
+        "price": 100,
+        "rent": (6, 12, 30, 90, 270, 400, 550),
+        "house_cost": 50,
+    },
+    {"name": "Chance", "type": "chance"},
+    {
+        "name": "Vermont Avenue",
+        "type": "property",
+        "color": PropertyColor.LIGHT_BLUE,
+        "price": 100,
+        "rent": (6, 12, 30, 90, 270, 400, 550),
+        "house_cost": 50,
+    },
+    {
+        "name": "Connecticut Avenue",
+        "type": "property",
+        "color": PropertyColor.LIGHT_BLUE,
+        "price": 120,
+        "rent": (8, 16, 40, 100, 300, 450, 600),
+        "house_cost": 50,
+    },
+    {"name": "Jail", "type": "jail"},
+    {
+        "name": "St. Charles Place",
+        "type": "property",
+        "color": PropertyColor.PINK,
+        "price": 140,
+        "rent": (10, 20, 50, 150, 450, 625, 750),
+        "house_cost": 100,
+    },
+    {"name": "Electric Company", "type": "utility"},
+    {
+        "name": "States Avenue",
+        "type": "property",
+        "color": PropertyColor.PINK,
+        "price": 140,
+        "rent": (10, 20, 50, 150, 450, 625, 750),
+        "house_cost": 100,
+    },
+    {
+        "name": "Virginia Avenue",
+        "type": "property",
+        "color": PropertyColor.PINK,
+        "price": 160,
+        "rent": (12, 24, 60, 180, 500, 700, 900),
+        "house_cost": 100,
+    },
+    {"name": "Pennsylvania Railroad", "type": "railroad"},
+    {
+        "name": "St. James Place",
+        "type": "property",
+        "color": PropertyColor.ORANGE,
+        "price": 180,
+        "rent": (14, 28, 70, 200, 550, 750, 950),
+        "house_cost": 100,
+    },
+    {"name": "Community Chest", "type": "community_chest"},
+    {
+        "name": "Tennessee Avenue",
+        "type": "property",
+        "color": PropertyColor.ORANGE,
+        "price": 180,
+        "rent": (14, 28, 70, 200, 550, 750, 950),
+        "house_cost": 100,
+    },
+    {
+        "name": "New York Avenue",
+        "type": "property",
+        "color": PropertyColor.ORANGE,
+        "price": 200,
+        "rent": (16, 32, 80, 220, 600, 800, 1000),
+        "house_cost": 100,
+    },
+    {"name": "Free Parking", "type": "free_parking"},
+    {
+        "name": "Kentucky Avenue",
+        "type": "property",
+        "color": PropertyColor.RED,
+        "price": 220,
+        "rent": (18, 36, 90, 250, 700, 875, 1050),
+        "house_cost": 150,
+    },
+    {"name": "Chance", "type": "chance"},
+    {
+        "name": "Indiana Avenue",
+        "type": "property",
+        "color": PropertyColor.RED,
+        "price": 220,
+        "rent": (18, 36, 90, 250, 700, 875, 1050),
+        "house_cost": 150,
+    },
+    {
+        "name": "Illinois Avenue",
+        "type": "property",
+        "color": PropertyColor.RED,
+        "price": 240,
+        "rent": (20, 40, 100, 300, 750, 925, 1100),
+        "house_cost": 150,
+    },
+    {"name": "B. & O. Railroad", "type": "railroad"},
+    {
+        "name": "Atlantic Avenue",
+        "type": "property",
+        "color": PropertyColor.YELLOW,
+        "price": 260,
+        "rent": (22, 44, 110, 330, 800, 975, 1150),
+        "house_cost": 150,
+    },
+    {
+        "name": "Ventnor Avenue",
+        "type": "property",
+        "color": PropertyColor.YELLOW,
+        "price": 260,
+        "rent": (22, 44, 110, 330, 800, 975, 1150),
+        "house_cost": 150,
+    },
+    {"name": "Water Works", "type": "utility"},
+    {
+        "name": "Marvin Gardens",
+        "type": "property",
+        "color": PropertyColor.YELLOW,
+        "price": 280,
+        "rent": (24, 48, 120, 360, 850, 1025, 1200),
+        "house_cost": 150,
+    },
+    {"name": "Go to Jail", "type": "go_to_jail"},
+    {
+        "name": "Pacific Avenue",
+        "type": "property",
+        "color": PropertyColor.GREEN,
+        "price": 300,
+        "rent": (26, 52, 130, 390, 900, 1100, 1275),
+        "house_cost": 200,
+    },
+    {
+        "name": "North Carolina Avenue",
+        "type": "property",
+        "color": PropertyColor.GREEN,
+        "price": 300,
+        "rent": (26, 52, 130, 390, 900, 1100, 1275),
+        "house_cost": 200,
+    },
+    {"name": "Community Chest", "type": "community_chest"},
+    {
+        "name": "Pennsylvania Avenue",
+        "type": "property",
+        "color": PropertyColor.GREEN,
+        "price": 320,
+        "rent": (28, 56, 150, 450, 1000, 1200, 1400),
+        "house_cost": 200,
+    },
+    {"name": "Short Line", "type": "railroad"},
+    {"name": "Chance", "type": "chance"},
+    {
+        "name": "Park Place",
+        "type": "property",
+        "color": PropertyColor.DARK_BLUE,
+        "price": 350,
+        "rent": (35, 70, 175, 500, 1100, 1300, 1500),
+        "house_cost": 200,
+    },
+    {"name": "Luxury Tax", "type": "tax", "amount": 100},
+    {
+        "name": "Boardwalk",
+        "type": "property",
+        "color": PropertyColor.DARK_BLUE,
+        "price": 400,
+        "rent": (50, 100, 200, 600, 1400, 1700, 2000),
+        "house_cost": 200,
+    },
+)
+
+
+def _next_position_table(targets: Tuple[int, ...]) -> Tuple[int, ...]:
+    """For each board position, the first target strictly ahead (wrapping past GO)"""
+    return tuple(
+        next((target for target in targets if target > position), targets[0])
+        for position in range(40)
+    )
+
+
+_NEXT_RAILROAD = _next_position_table(
+    tuple(i for i, d in enumerate(_PROPERTIES_DATA, 1) if d["type"] == "railroad")
+)
+_NEXT_UTILITY = _next_position_table(
+    tuple(i for i, d in enumerate(_PROPERTIES_DATA, 1) if d["type"] == "utility")
+)
+
+
+@dataclass(slots=True)
 class Property:
     name: str
     color: PropertyColor
@@ -63,6 +421,24 @@ class Property:
     houses: int = 0
     is_mortgaged: bool = False
     owner: Optional["Player"] = None
+    # Rent indexed by house count (index 5 is a hotel), built in __post_init__
+    _rent_by_houses: Tuple[int, ...] = field(
+        init=False, repr=False, compare=False
+    )
+    # (owner, owner portfolio version, houses, rent) of the last computed rent
+    _rent_cache: Tuple = field(
+        default=(None, -1, -1, 0), init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self):
+        self._rent_by_houses = (
+            self.rent_base,
+            self.rent_1_house,
+            self.rent_2_house,
+            self.rent_3_house,
+            self.rent_4_house,
+            self.rent_hotel,
+        )
 
     def get_rent_amount(self, dice_sum: int = 0) -> int:
         if self.is_mortgaged or self.owner is None:
@@ -70,40 +446,48 @@ class Property:
 
         if self.color == PropertyColor.UTILITY:
             multiplier = 10 if dice_sum > 0 else 4
-            utilities_owned_count = sum(
-                1
-                for prop in self.owner.properties
-                if prop.color == PropertyColor.UTILITY
-            )
+            utilities_owned_count = self.owner._color_counts[PropertyColor.UTILITY]
             return dice_sum * multiplier if utilities_owned_count == 2 else dice_sum * 4
 
+        # Railroad and street rent only change when the owner's portfolio or
+        # this property's buildings change, so reuse the last result
+        owner = self.owner
+        cached_owner, cached_version, cached_houses, cached_rent = self._rent_cache
+        if (
+            cached_owner is owner
+            and cached_version == owner._version
+            and cached_houses == self.houses
+        ):
+            return cached_rent
+
+        rent = self._calculate_rent()
+        self._rent_cache = (owner, owner._version, self.houses, rent)
+        return rent
+
+    def _calculate_rent(self) -> int:
         if self.color == PropertyColor.RAILROAD:
-            railroads_owned_count = sum(
-                1
-                for prop in self.owner.properties
-                if prop.color == PropertyColor.RAILROAD
-            )
+            railroads_owned_count = self.owner._color_counts[PropertyColor.RAILROAD]
             return 25 * (2 ** (railroads_owned_count - 1))
 
-        owns_monopoly = self.owner.owns_monopoly(self.color)
-
         if self.houses == 0:
-            return self.rent_with_set if owns_monopoly else self.rent_base
-        elif self.houses == 1:
-            return self.rent_1_house
-        elif self.houses == 2:
-            return self.rent_2_house
-        elif self.houses == 3:
-            return self.rent_3_house
-        elif self.houses == 4:
-            return self.rent_4_house
-        elif self.houses == 5:  # Hotel
-            return self.rent_hotel
-
-        return self.rent_base
-
-
-@dataclass
+            if self.owner.owns_monopoly(self.color):
+                return self.rent_with_set
+            return self.rent_base
+
+        return self._rent_by_houses[self.houses]
+
+    def set_mortgaged(self, mortgaged: bool):
+        """Toggle mortgage state, keeping the owner's monopoly counters in sync"""
+        if self.is_mortgaged == mortgaged:
+            return
+
+        self.is_mortgaged = mortgaged
+        if self.owner is not None:
+            self.owner._unmortgaged_color_counts[self.color] += -1 if mortgaged else 1
+            self.owner._version += 1
+
+
+@dataclass(slots=True)
 class BoardSpace:
     position: int
     name: str
@@ -112,7 +496,7 @@ class BoardSpace:
     tax_amount: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class Player:
     name: str
     position: int = 0
@@ -121,20 +505,66 @@ class Player:
     jail_turns: int = 0
     get_out_of_jail_free_cards: int = 0
     is_bankrupt: bool = False
+    # Per-color ownership counters, maintained by add_property/remove_property
+    # and Property.set_mortgaged so rent and monopoly checks avoid list scans
+    _color_counts: Counter = field(
+        default_factory=Counter, init=False, repr=False, compare=False
+    )
+    _unmortgaged_color_counts: Counter = field(
+        default_factory=Counter, init=False, repr=False, compare=False
+    )
+    # Bumped on every ownership or mortgage change; invalidates cached rents
+    _version: int = field(default=0, init=False, repr=False, compare=False)
+    # Property and building value for total_wealth, recomputed when dirty
+    _property_value: int = field(default=0, init=False, repr=False, compare=False)
+    _wealth_dirty: bool = field(default=True, init=False, repr=False, compare=False)
+    # Buildings across all owned properties, for repair card costs
+    _house_count: int = field(default=0, init=False, repr=False, compare=False)
+    _hotel_count: int = field(default=0, init=False, repr=False, compare=False)
+
+    def add_property(self, prop: Property):
+        prop.owner = self
+        self.properties.append(prop)
+        self._color_counts[prop.color] += 1
+        if not prop.is_mortgaged:
+            self._unmortgaged_color_counts[prop.color] += 1
+        self._count_buildings(prop, 1)
+        self._version += 1
+        self._wealth_dirty = True
+
+    def remove_property(self, prop: Property):
+        prop.owner = None
+        self.properties.remove(prop)
+        self._color_counts[prop.color] -= 1
+        if not prop.is_mortgaged:
+            self._unmortgaged_color_counts[prop.color] -= 1
+        self._count_buildings(prop, -1)
+        self._version += 1
+        self._wealth_dirty = True
+
+    def acquire(self, prop: Property, price: int):
+        """Pay price and take ownership of prop; callers check affordability"""
+        self.money -= price
+        self.add_property(prop)
+
+    def add_building(self, prop: Property):
+        """Build the next house on an owned property; the fifth is a hotel"""
+        self._count_buildings(prop, -1)
+        prop.houses += 1
+        self._count_buildings(prop, 1)
+        self._wealth_dirty = True
+
+    def _count_buildings(self, prop: Property, sign: int):
+        if prop.houses == 5:
+            self._hotel_count += sign
+        else:
+            self._house_count += sign * prop.houses
 
-    def owns_monopoly(self, color: PropertyColor) -> bool:
-        color_properties = [
-            p for p in self.properties if p.color == color and not p.is_mortgaged
-        ]
+    def repair_cost(self, per_house: int, per_hotel: int) -> int:
+        return per_house * self._house_count + per_hotel * self._hotel_count
 
-        if color == PropertyColor.BROWN or color == PropertyColor.DARK_BLUE:
-            return len(color_properties) == 2
-        elif color == PropertyColor.RAILROAD:
-            return len(color_properties) == 4
-        elif color == PropertyColor.UTILITY:
-            return len(color_properties) == 2
-        else:
-            return len(color_properties) == 3
+    def owns_monopoly(self, color: PropertyColor) -> bool:
+        return self._unmortgaged_color_counts[color] == _MONOPOLY_SIZE[color]
 
     def can_afford(self, amount: int) -> bool:
         return self.money >= amount
@@ -149,10 +579,50 @@ class Player:
         self.money += amount
 
     def total_wealth(self) -> int:
-        property_value = sum(
-            prop.price + (prop.houses * prop.house_cost) for prop in self.properties
+        if self._wealth_dirty:
+            self._property_value = sum(
+                prop.price + (prop.houses * prop.house_cost)
+                for prop in self.properties
+            )
+            self._wealth_dirty = False
+        return self.money + self._property_value
+
+
+@dataclass(slots=True)
+class TradeOffer:
+    # What each side gives up; player1 proposes, player2 accepts or declines
+    player1_properties: List[Property] = field(default_factory=list)
+    player1_cash: int = 0
+    player2_properties: List[Property] = field(default_factory=list)
+    player2_cash: int = 0
+
+    def is_empty(self) -> bool:
+        return not (
+            self.player1_properties
+            or self.player1_cash
+            or self.player2_properties
+            or self.player2_cash
         )
-        return self.money + property_value
+
+
+def _shuffled_deck(deck: Tuple[IntEnum, ...]) -> List:
+    """Return the cards of a deck in a fresh random order"""
+    return random.sample(deck, len(deck))
+
+
+def _parse_cash(text: str, limit: int) -> Optional[int]:
+    """Parse a cash amount for a trade, returning None if it is not within 0-limit"""
+    try:
+        amount = int(text)
+    except ValueError:
+        return None
+    return amount if 0 <= amount <= limit else None
+
+
+def _bounded_cash(text: str, limit: int) -> int:
+    """Parse a cash amount for a trade, treating anything outside 0-limit as 0"""
+    amount = _parse_cash(text, limit)
+    return 0 if amount is None else amount
 
 
 class MonopolyGame:
@@ -161,14 +631,24 @@ class MonopolyGame:
 
         self.console = Console()
         self.players = [Player(name) for name in player_names]
+        # Name lookup for the MCP tools; the first player wins a duplicate name
+        self.players_by_name: Dict[str, Player] = {
+            player.name: player for player in reversed(self.players)
+        }
         self.current_player_index = 0
         self.houses_remaining = 32
         self.hotels_remaining = 12
         self.game_over = False
         self.winner: Optional[Player] = None
+        # Players still in the game, in turn order; only _handle_bankruptcy
+        # changes it, together with Player.is_bankrupt
+        self._active_players: List[Player] = list(self.players)
+        self._dice_buffer: List[int] = []
 
         self._setup_board()
         self._setup_cards()
+        self._setup_landing_handlers()
+        self._setup_card_handlers()
 
     def _setup_board(self):
         """Initialize the Monopoly board with all spaces"""
@@ -178,9 +658,7 @@ class MonopolyGame:
         self.board_spaces.append(BoardSpace(0, "GO", SpaceType.GO))
 
         # Properties and other spaces
-        properties_data = self._get_properties_data()
-
-        for i, data in enumerate(properties_data):
+        for i, data in enumerate(_PROPERTIES_DATA):
             if data["type"] == "property":
                 prop = Property(
                     name=data["name"],
@@ -239,255 +717,38 @@ class MonopolyGame:
 
             self.board_spaces.append(space)
 
-    def _get_properties_data(self) -> List[Dict]:
-        """Return the complete Monopoly board data with USA property names"""
-        return [
-            {
-                "name": "Mediterranean Avenue",
-                "type": "property",
-                "color": PropertyColor.BROWN,
-                "price": 60,
-                "rent": [2, 4, 10, 30, 90, 160, 250],
-                "house_cost": 50,
-            },
-            {"name": "Community Chest", "type": "community_chest"},
-            {
-                "name": "Baltic Avenue",
-                "type": "property",
-                "color": PropertyColor.BROWN,
-                "price": 60,
-                "rent": [4, 8, 20, 60, 180, 320, 450],
-                "house_cost": 50,
-            },
-            {"name": "Income Tax", "type": "tax", "amount": 200},
-            {"name": "Reading Railroad", "type": "railroad"},
-            {
-                "name": "Oriental Avenue",
-                "type": "property",
-                "color": PropertyColor.LIGHT_BLUE,
-                "price": 100,
-                "rent": [6, 12, 30, 90, 270, 400, 550],
-                "house_cost": 50,
-            },
-            {"name": "Chance", "type": "chance"},
-            {
-                "name": "Vermont Avenue",
-                "type": "property",
-                "color": PropertyColor.LIGHT_BLUE,
-                "price": 100,
-                "rent": [6, 12, 30, 90, 270, 400, 550],
-                "house_cost": 50,
-            },
-            {
-                "name": "Connecticut Avenue",
-                "type": "property",
-                "color": PropertyColor.LIGHT_BLUE,
-                "price": 120,
-                "rent": [8, 16, 40, 100, 300, 450, 600],
-                "house_cost": 50,
-            },
-            {"name": "Jail", "type": "jail"},
-            {
-                "name": "St. Charles Place",
-                "type": "property",
-                "color": PropertyColor.PINK,
-                "price": 140,
-                "rent": [10, 20, 50, 150, 450, 625, 750],
-                "house_cost": 100,
-            },
-            {"name": "Electric Company", "type": "utility"},
-            {
-                "name": "States Avenue",
-                "type": "property",
-                "color": PropertyColor.PINK,
-                "price": 140,
-                "rent": [10, 20, 50, 150, 450, 625, 750],
-                "house_cost": 100,
-            },
-            {
-                "name": "Virginia Avenue",
-                "type": "property",
-                "color": PropertyColor.PINK,
-                "price": 160,
-                "rent": [12, 24, 60, 180, 500, 700, 900],
-                "house_cost": 100,
-            },
-            {"name": "Pennsylvania Railroad", "type": "railroad"},
-            {
-                "name": "St. James Place",
-                "type": "property",
-                "color": PropertyColor.ORANGE,
-                "price": 180,
-                "rent": [14, 28, 70, 200, 550, 750, 950],
-                "house_cost": 100,
-            },
-            {"name": "Community Chest", "type": "community_chest"},
-            {
-                "name": "Tennessee Avenue",
-                "type": "property",
-                "color": PropertyColor.ORANGE,
-                "price": 180,
-                "rent": [14, 28, 70, 200, 550, 750, 950],
-                "house_cost": 100,
-            },
-            {
-                "name": "New York Avenue",
-                "type": "property",
-                "color": PropertyColor.ORANGE,
-                "price": 200,
-                "rent": [16, 32, 80, 220, 600, 800, 1000],
-                "house_cost": 100,
-            },
-            {"name": "Free Parking", "type": "free_parking"},
-            {
-                "name": "Kentucky Avenue",
-                "type": "property",
-                "color": PropertyColor.RED,
-                "price": 220,
-                "rent": [18, 36, 90, 250, 700, 875, 1050],
-                "house_cost": 150,
-            },
-            {"name": "Chance", "type": "chance"},
-            {
-                "name": "Indiana Avenue",
-                "type": "property",
-                "color": PropertyColor.RED,
-                "price": 220,
-                "rent": [18, 36, 90, 250, 700, 875, 1050],
-                "house_cost": 150,
-            },
-            {
-                "name": "Illinois Avenue",
-                "type": "property",
-                "color": PropertyColor.RED,
-                "price": 240,
-                "rent": [20, 40, 100, 300, 750, 925, 1100],
-                "house_cost": 150,
-            },
-            {"name": "B. & O. Railroad", "type": "railroad"},
-            {
-                "name": "Atlantic Avenue",
-                "type": "property",
-                "color": PropertyColor.YELLOW,
-                "price": 260,
-                "rent": [22, 44, 110, 330, 800, 975, 1150],
-                "house_cost": 150,
-            },
-            {
-                "name": "Ventnor Avenue",
-                "type": "property",
-                "color": PropertyColor.YELLOW,
-                "price": 260,
-                "rent": [22, 44, 110, 330, 800, 975, 1150],
-                "house_cost": 150,
-            },
-            {"name": "Water Works", "type": "utility"},
-            {
-                "name": "Marvin Gardens",
-                "type": "property",
-                "color": PropertyColor.YELLOW,
-                "price": 280,
-                "rent": [24, 48, 120, 360, 850, 1025, 1200],
-                "house_cost": 150,
-            },
-            {"name": "Go to Jail", "type": "go_to_jail"},
-            {
-                "name": "Pacific Avenue",
-                "type": "property",
-                "color": PropertyColor.GREEN,
-                "price": 300,
-                "rent": [26, 52, 130, 390, 900, 1100, 1275],
-                "house_cost": 200,
-            },
-            {
-                "name": "North Carolina Avenue",
-                "type": "property",
-                "color": PropertyColor.GREEN,
-                "price": 300,
-                "rent": [26, 52, 130, 390, 900, 1100, 1275],
-                "house_cost": 200,
-            },
-            {"name": "Community Chest", "type": "community_chest"},
-            {
-                "name": "Pennsylvania Avenue",
-                "type": "property",
-                "color": PropertyColor.GREEN,
-                "price": 320,
-                "rent": [28, 56, 150, 450, 1000, 1200, 1400],
-                "house_cost": 200,
-            },
-            {"name": "Short Line", "type": "railroad"},
-            {"name": "Chance", "type": "chance"},
-            {
-                "name": "Park Place",
-                "type": "property",
-                "color": PropertyColor.DARK_BLUE,
-                "price": 350,
-                "rent": [35, 70, 175, 500, 1100, 1300, 1500],
-                "house_cost": 200,
-            },
-            {"name": "Luxury Tax", "type": "tax", "amount": 100},
-            {
-                "name": "Boardwalk",
-                "type": "property",
-                "color": PropertyColor.DARK_BLUE,
-                "price": 400,
-                "rent": [50, 100, 200, 600, 1400, 1700, 2000],
-                "house_cost": 200,
-            },
-        ]
-
     def _setup_cards(self):
         """Initialize Chance and Community Chest cards"""
-        self.chance_cards = [
-            "Advance to Boardwalk",
-            "Advance to Go (Collect $200)",
-            "Advance to Illinois Avenue. If you pass Go, collect $200",
-            "Advance to St. Charles Place. If you pass Go, collect $200",
-            "Advance to the nearest Railroad. If unowned, you may buy it from the Bank. If owned, pay owner twice the rental to which they are otherwise entitled",
-            "Advance to the nearest Railroad. If unowned, you may buy it from the Bank. If owned, pay owner twice the rental to which they are otherwise entitled",
-            "Advance token to nearest Utility. If unowned, you may buy it from the Bank. If owned, throw dice and pay owner a total ten times amount thrown",
-            "Bank pays you dividend of $50",
-            "Get Out of Jail Free",
-            "Go Back 3 Spaces",
-            "Go to Jail. Go directly to Jail, do not pass Go, do not collect $200",
-            "Make general repairs on all your property. For each house pay $25. For each hotel pay $100",
-            "Speeding fine $15",
-            "Take a trip to Reading Railroad. If you pass Go, collect $200",
-            "You have been elected Chairman of the Board. Pay each player $50",
-            "Your building loan matures. Collect $150",
-        ]
-
-        self.community_chest_cards = [
-            "Advance to Go (Collect $200)",
-            "Bank error in your favor. Collect $200",
-            "Doctor's fee. Pay $50",
-            "From sale of stock you get $50",
-            "Get Out of Jail Free",
-            "Go to Jail. Go directly to jail, do not pass Go, do not collect $200",
-            "Holiday fund matures. Receive $100",
-            "Income tax refund. Collect $20",
-            "It is your birthday. Collect $10 from every player",
-            "Life insurance matures. Collect $100",
-            "Pay hospital fees of $100",
-            "Pay school fees of $50",
-            "Receive $25 consultancy fee",
-            "You are assessed for street repair. $40 per house. $115 per hotel",
-            "You have won second prize in a beauty contest. Collect $10",
-            "You inherit $100",
-        ]
-
-        random.shuffle(self.chance_cards)
-        random.shuffle(self.community_chest_cards)
+        self.chance_cards: List[ChanceCard] = _shuffled_deck(_CHANCE_DECK)
+        self.community_chest_cards: List[CommunityChestCard] = _shuffled_deck(
+            _COMMUNITY_CHEST_DECK
+        )
 
     def get_current_player(self) -> Player:
         return self.players[self.current_player_index]
 
     def next_turn(self):
-        self.current_player_index = (self.current_player_index + 1) % len(self.players)
+        """Advance to the next player who is not bankrupt"""
+        player_count = len(self.players)
+        for offset in range(1, player_count + 1):
+            index = (self.current_player_index + offset) % player_count
+            if not self.players[index].is_bankrupt:
+                self.current_player_index = index
+                return
 
     def roll_dice(self) -> Tuple[int, int]:
-        return random.randint(1, 6), random.randint(1, 6)
+        if not self._dice_buffer:
+            self._dice_buffer = random.choices(_DICE_FACES, k=_DICE_BATCH_SIZE)
+        return self._dice_buffer.pop(), self._dice_buffer.pop()
+
+    def move_player(self, player: Player, steps: int) -> bool:
+        """Move a player forward and pay $200 if they pass GO; return whether they did"""
+        old_position = player.position
+        player.position = (old_position + steps) % 40
+        if player.position < old_position:
+            player.receive(200)
+            return True
+        return False
 
     def run_game(self):
         """Main game loop"""
@@ -499,10 +760,6 @@ class MonopolyGame:
             self._display_game_state()
             current_player = self.get_current_player()
 
-            if current_player.is_bankrupt:
-                self.next_turn()
-                continue
-
             self._play_turn(current_player)
             self._check_game_over()
 
@@ -516,8 +773,6 @@ class MonopolyGame:
 
     def _display_game_state(self):
         """Display current game state with board and player info"""
-        self.console.print("\n" + "=" * 80)
-
         # Display player summary
         table = Table(title="Player Status")
         table.add_column("Player", style="cyan", no_wrap=True)
@@ -545,49 +800,36 @@ class MonopolyGame:
                 f"${net_worth}",
             )
 
-        self.console.print(table)
-
-        # Display board positions with players
-        self._display_board_summary()
+        # Render separator, table and board summary in a single print
+        self.console.print(
+            Group("\n" + "=" * 80, table, *self._board_summary_lines())
+        )
 
-    def _display_board_summary(self):
-        """Display a summary of key board positions"""
-        # Show properties owned by each player
+    def _board_summary_lines(self) -> List[str]:
+        """Build a summary line of owned properties for each player"""
+        lines = []
         for player in self.players:
             if player.properties:
-                props_by_color = {}
+                props_by_color: Dict[PropertyColor, List[str]] = {}
                 for prop in player.properties:
-                    color_name = prop.color.name.replace("_", " ").title()
-                    if color_name not in props_by_color:
-                        props_by_color[color_name] = []
-                    props_by_color[color_name].append(prop.name)
-
-                prop_summary = []
-                for color, props in props_by_color.items():
-                    monopoly_marker = (
-                        "🏠"
-                        if len(props)
-                        >= self._get_monopoly_size(player.properties[0].color)
-                        else ""
-                    )
-                    prop_summary.append(
-                        f"{color}: {', '.join(props)} {monopoly_marker}"
-                    )
-
-                self.console.print(
-                    f"[bold]{player.name}'s Properties:[/bold] {' | '.join(prop_summary)}"
+                    props_by_color.setdefault(prop.color, []).append(prop.name)
+
+                prop_summary = " | ".join(
+                    [
+                        f"{_COLOR_DISPLAY[color]}: {', '.join(props)} "
+                        f"{'🏠' if len(props) >= self._get_monopoly_size(color) else ''}"
+                        for color, props in props_by_color.items()
+                    ]
+                )
+                lines.append(
+                    f"[bold]{player.name}'s Properties:[/bold] {prop_summary}"
                 )
 
+        return lines
+
     def _get_monopoly_size(self, color: PropertyColor) -> int:
         """Get the number of properties needed for a monopoly of this color"""
-        if color in [PropertyColor.BROWN, PropertyColor.DARK_BLUE]:
-            return 2
-        elif color == PropertyColor.RAILROAD:
-            return 4
-        elif color == PropertyColor.UTILITY:
-            return 2
-        else:
-            return 3
+        return _MONOPOLY_SIZE[color]
 
     def _show_property_management_menu(self, player: Player):
         """Show property management options"""
@@ -595,8 +837,6 @@ class MonopolyGame:
             self.console.print("You don't own any properties.")
             return
 
-        self.console.print(f"\n[bold]{player.name}'s Property Management[/bold]")
-
         # Show property details
         table = Table()
         table.add_column("Property", style="cyan")
@@ -606,20 +846,20 @@ class MonopolyGame:
         table.add_column("Mortgage", style="red")
 
         for prop in player.properties:
-            color_name = prop.color.name.replace("_", " ").title()
+            color_name = _COLOR_DISPLAY[prop.color]
             houses = "🏨" if prop.houses == 5 else "🏠" * prop.houses
             rent = f"${prop.get_rent_amount()}"
             mortgage_status = "🔒" if prop.is_mortgaged else f"${prop.mortgage_value}"
 
             table.add_row(prop.name, color_name, houses, rent, mortgage_status)
 
-        self.console.print(table)
-
         # Property management actions
         choices = ["1", "2", "3", "4"]
         menu = "1. Build houses/hotels\n2. Mortgage/Unmortgage properties\n3. Trade properties\n4. Continue game"
 
-        self.console.print(menu)
+        self.console.print(
+            Group(f"\n[bold]{player.name}'s Property Management[/bold]", table, menu)
+        )
         action = Prompt.ask("Choose action", choices=choices, default="4")
 
         if action == "1":
@@ -634,7 +874,7 @@ class MonopolyGame:
         buildable_props = []
         for prop in player.properties:
             if (
-                prop.color not in [PropertyColor.RAILROAD, PropertyColor.UTILITY]
+                prop.color not in _NON_BUILDABLE
                 and player.owns_monopoly(prop.color)
                 and not prop.is_mortgaged
                 and prop.houses < 5
@@ -662,7 +902,7 @@ class MonopolyGame:
             prop = buildable_props[choice - 1]
             if player.can_afford(prop.house_cost) and self.houses_remaining > 0:
                 player.pay(prop.house_cost)
-                prop.houses += 1
+                player.add_building(prop)
                 if prop.houses < 5:
                     self.houses_remaining -= 1
                 else:
@@ -681,7 +921,7 @@ class MonopolyGame:
         """Show building status for player's monopolies"""
         monopolies = {}
         for prop in player.properties:
-            if (prop.color not in [PropertyColor.RAILROAD, PropertyColor.UTILITY] and 
+            if (prop.color not in _NON_BUILDABLE and 
                 player.owns_monopoly(prop.color)):
                 if prop.color not in monopolies:
                     monopolies[prop.color] = []
@@ -733,7 +973,7 @@ class MonopolyGame:
                         == "y"
                     ):
                         player.pay(unmortgage_cost)
-                        prop.is_mortgaged = False
+                        prop.set_mortgaged(False)
                         self.console.print(f"Unmortgaged {prop.name}!")
                 else:
                     self.console.print("Cannot afford to unmortgage.")
@@ -745,7 +985,7 @@ class MonopolyGame:
                     == "y"
                 ):
                     player.receive(prop.mortgage_value)
-                    prop.is_mortgaged = True
+                    prop.set_mortgaged(True)
                     self.console.print(f"Mortgaged {prop.name}!")
         except (ValueError, IndexError):
             self.console.print("Invalid choice.")
@@ -753,9 +993,7 @@ class MonopolyGame:
     def _handle_trading(self, player: Player):
         """Handle property trading between players"""
         other_players = [
-            p
-            for p in self.players
-            if p != player and not p.is_bankrupt and p.properties
+            p for p in self._active_players if p is not player and p.properties
         ]
 
         if not other_players:
@@ -812,8 +1050,6 @@ class MonopolyGame:
             self.console.print(f"{title}: None")
             return
 
-        self.console.print(f"\n[bold]{title}:[/bold]")
-
         table = Table()
         table.add_column("#", style="dim")
         table.add_column("Property", style="cyan")
@@ -822,7 +1058,7 @@ class MonopolyGame:
         table.add_column("Status", style="yellow")
 
         for i, prop in enumerate(player.properties):
-            color_name = prop.color.name.replace("_", " ").title()
+            color_name = _COLOR_DISPLAY[prop.color]
             value = f"${prop.price}"
             status = "Mortgaged" if prop.is_mortgaged else "Clear"
             if prop.houses > 0:
@@ -830,19 +1066,85 @@ class MonopolyGame:
 
             table.add_row(str(i + 1), prop.name, color_name, value, status)
 
-        self.console.print(table)
-        self.console.print(f"Cash: ${player.money}")
+        self.console.print(
+            Group(f"\n[bold]{title}:[/bold]", table, f"Cash: ${player.money}")
+        )
 
-    def _build_trade_offer(self, player1: Player, player2: Player):
+    def _build_trade_offer(
+        self, player1: Player, player2: Player
+    ) -> Optional[TradeOffer]:
         """Build a trade offer from player1 to player2"""
-        offer = {
-            "player1_properties": [],
-            "player1_cash": 0,
-            "player2_properties": [],
-            "player2_cash": 0,
-        }
+        self.console.print(_TRADE_HEADER_MESSAGE)
+
+        # The whole offer can be given on one line; anything else falls back
+        # to asking for each part in turn
+        line = Prompt.ask(
+            "Offer in one line (e.g. give=1,3 cash=100 want=5 wantcash=50), "
+            "or Enter for step by step",
+            default="",
+        )
+        offer = self._parse_trade_line(line, player1, player2) if line.strip() else None
+        if offer is None:
+            if line.strip():
+                self.console.print("Could not read that offer - enter it step by step.")
+            offer = self._prompt_trade_offer(player1, player2)
+
+        # Validate trade has something
+        if offer.is_empty():
+            self.console.print("No valid trade items selected.")
+            return None
 
-        self.console.print("\n[bold]Building Trade Offer[/bold]")
+        return offer
+
+    def _parse_trade_line(
+        self, line: str, player1: Player, player2: Player
+    ) -> Optional[TradeOffer]:
+        """Parse a one-line trade offer, returning None if any term is invalid
+
+        Unlike the step-by-step prompts, nothing is dropped or zeroed: an
+        offer is only returned if it is exactly what the line asked for.
+        """
+        terms: Dict[str, str] = {}
+        for token in line.split():
+            match = _TRADE_TERM_RE.fullmatch(token)
+            if match is None or match[1] in terms:
+                return None
+            terms[match[1]] = match[2]
+
+        player1_properties = self._parse_trade_properties(
+            player1, terms.get("give", ""), "trade"
+        )
+        player1_cash = _parse_cash(terms.get("cash", "0"), player1.money)
+        player2_properties = self._parse_trade_properties(
+            player2, terms.get("want", ""), "request"
+        )
+        player2_cash = _parse_cash(terms.get("wantcash", "0"), player2.money)
+        if (
+            player1_properties is None
+            or player1_cash is None
+            or player2_properties is None
+            or player2_cash is None
+        ):
+            return None
+
+        return TradeOffer(
+            player1_properties=player1_properties,
+            player1_cash=player1_cash,
+            player2_properties=player2_properties,
+            player2_cash=player2_cash,
+        )
+
+    def _parse_trade_properties(
+        self, owner: Player, text: str, verb: str
+    ) -> Optional[List[Property]]:
+        """Resolve property numbers, returning None unless every one can be traded"""
+        numbers = list(dict.fromkeys(_NUMBER_RE.findall(text)))
+        picked = self._pick_trade_properties(owner, numbers, verb)
+        return picked if len(picked) == len(numbers) else None
+
+    def _prompt_trade_offer(self, player1: Player, player2: Player) -> TradeOffer:
+        """Ask for each part of a trade offer with a separate prompt"""
+        offer = TradeOffer()
         self.console.print("What will you give?")
 
         # Player 1 offers properties
@@ -852,31 +1154,18 @@ class MonopolyGame:
                 default="none",
             )
             if prop_choices.lower() != "none":
-                try:
-                    prop_indices = [int(x.strip()) - 1 for x in prop_choices.split(",")]
-                    for idx in prop_indices:
-                        if 0 <= idx < len(player1.properties):
-                            prop = player1.properties[idx]
-                            if (
-                                prop.houses == 0
-                            ):  # Can't trade properties with buildings
-                                offer["player1_properties"].append(prop)
-                            else:
-                                self.console.print(
-                                    f"Cannot trade {prop.name} - has buildings"
-                                )
-                except ValueError:
+                if _PROPERTY_LIST_RE.fullmatch(prop_choices):
+                    offer.player1_properties = self._pick_trade_properties(
+                        player1, _NUMBER_RE.findall(prop_choices), "trade"
+                    )
+                else:
                     self.console.print("Invalid property selection")
 
         # Player 1 offers cash
-        try:
-            cash_offer = int(
-                Prompt.ask(f"Cash to give (0-{player1.money})", default="0")
-            )
-            if 0 <= cash_offer <= player1.money:
-                offer["player1_cash"] = cash_offer
-        except ValueError:
-            pass
+        offer.player1_cash = _bounded_cash(
+            Prompt.ask(f"Cash to give (0-{player1.money})", default="0"),
+            player1.money,
+        )
 
         self.console.print("\nWhat do you want in return?")
 
@@ -887,111 +1176,106 @@ class MonopolyGame:
                 default="none",
             )
             if prop_choices.lower() != "none":
-                try:
-                    prop_indices = [int(x.strip()) - 1 for x in prop_choices.split(",")]
-                    for idx in prop_indices:
-                        if 0 <= idx < len(player2.properties):
-                            prop = player2.properties[idx]
-                            if prop.houses == 0:
-                                offer["player2_properties"].append(prop)
-                            else:
-                                self.console.print(
-                                    f"Cannot request {prop.name} - has buildings"
-                                )
-                except ValueError:
+                if _PROPERTY_LIST_RE.fullmatch(prop_choices):
+                    offer.player2_properties = self._pick_trade_properties(
+                        player2, _NUMBER_RE.findall(prop_choices), "request"
+                    )
+                else:
                     self.console.print("Invalid property selection")
 
         # Player 1 wants cash
-        try:
-            cash_wanted = int(
-                Prompt.ask(f"Cash you want (0-{player2.money})", default="0")
-            )
-            if 0 <= cash_wanted <= player2.money:
-                offer["player2_cash"] = cash_wanted
-        except ValueError:
-            pass
-
-        # Validate trade has something
-        if (
-            not offer["player1_properties"]
-            and offer["player1_cash"] == 0
-            and not offer["player2_properties"]
-            and offer["player2_cash"] == 0
-        ):
-            self.console.print("No valid trade items selected.")
-            return None
+        offer.player2_cash = _bounded_cash(
+            Prompt.ask(f"Cash you want (0-{player2.money})", default="0"),
+            player2.money,
+        )
 
         return offer
 
-    def _present_trade_offer(self, player1: Player, player2: Player, offer) -> bool:
+    def _pick_trade_properties(
+        self, owner: Player, numbers: List[str], verb: str
+    ) -> List[Property]:
+        """Resolve 1-based property numbers from the trade listing of owner"""
+        owned = owner.properties
+        picked = []
+        for number in dict.fromkeys(numbers):
+            idx = int(number) - 1
+            if 0 <= idx < len(owned):
+                prop = owned[idx]
+                if prop.houses == 0:  # Can't trade properties with buildings
+                    picked.append(prop)
+                else:
+                    self.console.print(f"Cannot {verb} {prop.name} - has buildings")
+        return picked
+
+    def _present_trade_offer(
+        self, player1: Player, player2: Player, offer: TradeOffer
+    ) -> bool:
         """Present trade offer to player2 for acceptance"""
-        self.console.print(f"\n[bold]Trade Offer for {player2.name}[/bold]")
+        lines = [f"\n[bold]Trade Offer for {player2.name}[/bold]"]
 
         # Show what player2 would give
-        self.console.print("[red]You would give:[/red]")
-        for prop in offer["player2_properties"]:
-            self.console.print(f"  • {prop.name}")
-        if offer["player2_cash"] > 0:
-            self.console.print(f"  • ${offer['player2_cash']} cash")
+        lines.append("[red]You would give:[/red]")
+        for prop in offer.player2_properties:
+            lines.append(f"  • {prop.name}")
+        if offer.player2_cash > 0:
+            lines.append(f"  • ${offer.player2_cash} cash")
 
         # Show what player2 would receive
-        self.console.print("[green]You would receive:[/green]")
-        for prop in offer["player1_properties"]:
-            self.console.print(f"  • {prop.name}")
-        if offer["player1_cash"] > 0:
-            self.console.print(f"  • ${offer['player1_cash']} cash")
+        lines.append("[green]You would receive:[/green]")
+        for prop in offer.player1_properties:
+            lines.append(f"  • {prop.name}")
+        if offer.player1_cash > 0:
+            lines.append(f"  • ${offer.player1_cash} cash")
 
+        self.console.print("\n".join(lines))
         accept = Prompt.ask("Accept this trade?", choices=["y", "n"], default="n")
         return accept.lower() == "y"
 
-    def _execute_trade(self, player1: Player, player2: Player, offer):
+    def _execute_trade(self, player1: Player, player2: Player, offer: TradeOffer):
         """Execute the agreed trade"""
-        self.console.print(
+        lines = [
             f"\n[green]Executing trade between {player1.name} and {player2.name}[/green]"
-        )
+        ]
 
         # Transfer properties from player1 to player2
-        for prop in offer["player1_properties"]:
-            player1.properties.remove(prop)
-            player2.properties.append(prop)
-            prop.owner = player2
-            self.console.print(f"  {prop.name}: {player1.name} → {player2.name}")
+        for prop in offer.player1_properties:
+            player1.remove_property(prop)
+            player2.add_property(prop)
+            lines.append(_TRANSFER_LINE(prop.name, player1.name, player2.name))
 
         # Transfer properties from player2 to player1
-        for prop in offer["player2_properties"]:
-            player2.properties.remove(prop)
-            player1.properties.append(prop)
-            prop.owner = player1
-            self.console.print(f"  {prop.name}: {player2.name} → {player1.name}")
+        for prop in offer.player2_properties:
+            player2.remove_property(prop)
+            player1.add_property(prop)
+            lines.append(_TRANSFER_LINE(prop.name, player2.name, player1.name))
 
         # Transfer cash
-        if offer["player1_cash"] > 0:
-            player1.pay(offer["player1_cash"])
-            player2.receive(offer["player1_cash"])
-            self.console.print(
-                f"  ${offer['player1_cash']}: {player1.name} → {player2.name}"
+        if offer.player1_cash > 0:
+            player1.pay(offer.player1_cash)
+            player2.receive(offer.player1_cash)
+            lines.append(
+                _TRANSFER_LINE(f"${offer.player1_cash}", player1.name, player2.name)
             )
 
-        if offer["player2_cash"] > 0:
-            player2.pay(offer["player2_cash"])
-            player1.receive(offer["player2_cash"])
-            self.console.print(
-                f"  ${offer['player2_cash']}: {player2.name} → {player1.name}"
+        if offer.player2_cash > 0:
+            player2.pay(offer.player2_cash)
+            player1.receive(offer.player2_cash)
+            lines.append(
+                _TRANSFER_LINE(f"${offer.player2_cash}", player2.name, player1.name)
             )
 
-        self.console.print("[green]Trade completed successfully![/green]")
+        lines.append("[green]Trade completed successfully![/green]")
+        self.console.print("\n".join(lines))
 
-    def _auction_property(self, property: Property):
+    def _auction_property(self, prop: Property):
         """Conduct an auction for an unowned property"""
         self.console.print(
-            f"\n[bold yellow]🔨 AUCTION: {property.name} 🔨[/bold yellow]"
+            f"\n[bold yellow]🔨 AUCTION: {prop.name} 🔨[/bold yellow]\n"
+            "Starting bid: $10"
         )
-        self.console.print("Starting bid: $10")
 
         # Get eligible bidders (players with at least $10)
-        eligible_bidders = [
-            p for p in self.players if not p.is_bankrupt and p.money >= 10
-        ]
+        eligible_bidders = [p for p in self._active_players if p.money >= 10]
 
         if len(eligible_bidders) < 2:
             self.console.print(
@@ -1002,18 +1286,22 @@ class MonopolyGame:
         current_bid = 10
         current_winner = None
         active_bidders = eligible_bidders.copy()
+        # Each bidder's latest move, shown in the per-round status panel
+        actions = {bidder.name: "Waiting" for bidder in eligible_bidders}
 
         while len(active_bidders) > 1:
-            self.console.print(f"\nCurrent bid: ${current_bid}")
-            if current_winner:
-                self.console.print(f"Leading bidder: {current_winner.name}")
-
-            # Get bids from each active bidder
-            new_active_bidders = []
+            self.console.print(
+                self._render_auction_panel(
+                    prop, current_bid, current_winner, actions
+                )
+            )
 
+            # Get bids from each active bidder, keeping those who bid at the
+            # front of active_bidders so no new list is built each round
+            write = 0
             for bidder in active_bidders:
                 if bidder.money <= current_bid:
-                    self.console.print(f"{bidder.name} cannot afford to bid higher.")
+                    actions[bidder.name] = "Cannot afford to bid higher"
                     continue
 
                 max_bid = min(
@@ -1027,42 +1315,47 @@ class MonopolyGame:
                     )
 
                     if bid_input.lower() == "pass":
-                        self.console.print(f"{bidder.name} passes.")
+                        actions[bidder.name] = "Passed"
                         continue
 
                     bid_amount = int(bid_input)
 
                     if bid_amount <= current_bid:
-                        self.console.print(
-                            f"Bid must be higher than ${current_bid}. {bidder.name} passes."
+                        actions[bidder.name] = (
+                            f"Bid must be higher than ${current_bid} - passed"
                         )
                         continue
 
                     if bid_amount > bidder.money:
-                        self.console.print(f"Insufficient funds. {bidder.name} passes.")
+                        actions[bidder.name] = "Insufficient funds - passed"
                         continue
 
                     # Valid bid
                     current_bid = bid_amount
                     current_winner = bidder
-                    new_active_bidders.append(bidder)
-                    self.console.print(f"✅ {bidder.name} bids ${bid_amount}")
+                    active_bidders[write] = bidder
+                    write += 1
+                    actions[bidder.name] = f"✅ Bid ${bid_amount}"
 
                 except ValueError:
-                    self.console.print(f"Invalid bid. {bidder.name} passes.")
+                    actions[bidder.name] = "Invalid bid - passed"
                     continue
 
-            active_bidders = new_active_bidders
+            del active_bidders[write:]
 
             # If only one person bid this round, give others one more chance
             if len(active_bidders) == 1 and current_winner:
                 self.console.print(
-                    f"\nFinal call! ${current_bid} going once, going twice..."
+                    self._render_auction_panel(
+                        prop, current_bid, current_winner, actions
+                    ),
+                    f"Final call! ${current_bid} going once, going twice...",
                 )
 
-                final_bidders = []
+                # Only final-call bidders stay in; with none the auction ends
+                active_bidders.clear()
                 for bidder in eligible_bidders:
-                    if bidder != current_winner and bidder.money > current_bid:
+                    if bidder is not current_winner and bidder.money > current_bid:
                         try:
                             final_bid = Prompt.ask(
                                 f"{bidder.name}, final chance to bid (higher than ${current_bid}, or 'pass')",
@@ -1077,39 +1370,60 @@ class MonopolyGame:
                                 ):
                                     current_bid = bid_amount
                                     current_winner = bidder
-                                    final_bidders.append(bidder)
-                                    self.console.print(
-                                        f"✅ {bidder.name} bids ${bid_amount}"
-                                    )
+                                    active_bidders.append(bidder)
+                                    actions[bidder.name] = f"✅ Bid ${bid_amount}"
                         except ValueError:
                             continue
 
-                if not final_bidders:
-                    break
-
-                active_bidders = final_bidders
-
         # Auction complete
         if current_winner and current_bid > 0:
-            current_winner.pay(current_bid)
-            property.owner = current_winner
-            current_winner.properties.append(property)
+            current_winner.acquire(prop, current_bid)
 
-            self.console.print("\n[bold green]🔨 SOLD! 🔨[/bold green]")
             self.console.print(
-                f"{current_winner.name} wins {property.name} for ${current_bid}"
+                "\n[bold green]🔨 SOLD! 🔨[/bold green]\n"
+                f"{current_winner.name} wins {prop.name} for ${current_bid}"
             )
         else:
             self.console.print(
-                f"\n[yellow]No winning bids - {property.name} remains unowned.[/yellow]"
+                self._render_auction_panel(
+                    prop, current_bid, current_winner, actions
+                ),
+                f"\n[yellow]No winning bids - {prop.name} remains unowned.[/yellow]",
             )
 
+    def _render_auction_panel(
+        self,
+        prop: Property,
+        current_bid: int,
+        current_winner: Optional[Player],
+        actions: Dict[str, str],
+    ) -> Panel:
+        """Build the status panel shown at the start of each bidding round"""
+        table = Table()
+        table.add_column("Bidder", style="cyan")
+        table.add_column("Last action", style="yellow")
+        for name, action in actions.items():
+            table.add_row(name, action)
+
+        leader = current_winner.name if current_winner else "None"
+        return Panel(
+            Group(f"Current bid: ${current_bid}   Leading bidder: {leader}", table),
+            title=f"🔨 {prop.name}",
+            border_style="yellow",
+        )
+
     def _play_turn(self, player: Player):
-        """Execute a single player's turn"""
+        """Execute a player's turn, rolling again for as long as they throw doubles"""
+        first_roll = True
+        while self._play_turn_once(player, first_roll):
+            first_roll = False
+
+    def _play_turn_once(self, player: Player, first_roll: bool = True) -> bool:
+        """Play one roll of a turn and return whether the player rolls again"""
         self.console.print(f"\n[bold]{player.name}'s Turn[/bold] (${player.money})")
 
-        # Pre-roll property management
-        if player.properties and not player.jail_turns:
+        # Pre-roll property management, offered once per turn
+        if first_roll and player.properties and not player.jail_turns:
             manage = Prompt.ask(
                 "Manage properties before rolling?", choices=["y", "n"], default="n"
             )
@@ -1118,7 +1432,7 @@ class MonopolyGame:
 
         if player.jail_turns > 0:
             self._handle_jail_turn(player)
-            return
+            return False
 
         # Wait for player to roll
         Prompt.ask(f"{player.name}, press Enter to roll dice", default="")
@@ -1130,16 +1444,11 @@ class MonopolyGame:
 
         self.console.print(f"🎲 Rolled: {die1} + {die2} = {dice_sum}")
         if is_doubles:
-            self.console.print("🎲 Doubles! You get another turn after this one.")
+            self.console.print(_DOUBLES_MESSAGE)
 
-        # Move player
-        old_position = player.position
-        player.position = (player.position + dice_sum) % 40
-
-        # Check if passed GO
-        if player.position < old_position:
-            player.receive(200)
-            self.console.print("💰 Passed GO! Collect $200")
+        # Move player, collecting $200 for passing GO
+        if self.move_player(player, dice_sum):
+            self.console.print(_PASSED_GO_MESSAGE)
 
         # Handle landing on space
         current_space = self.board_spaces[player.position]
@@ -1148,9 +1457,10 @@ class MonopolyGame:
         self._handle_space_landing(player, current_space, dice_sum)
 
         # Handle doubles
-        if is_doubles and player.jail_turns == 0:
-            self.console.print("🎲 Rolling again due to doubles!")
-            self._play_turn(player)  # Recursive call for doubles
+        if is_doubles and player.jail_turns == 0 and not player.is_bankrupt:
+            self.console.print(_ROLL_AGAIN_MESSAGE)
+            return True
+        return False
 
     def _handle_jail_turn(self, player: Player):
         """Handle a turn while in jail"""
@@ -1180,42 +1490,124 @@ class MonopolyGame:
                 self.console.print(f"🎲 Rolled: {die1}, {die2} - Still in jail")
                 player.jail_turns += 1
                 if player.jail_turns > 3:
-                    self.console.print("Must pay $50 to get out!")
+                    self.console.print(_JAIL_FORCED_FINE_MESSAGE)
                     player.pay(50)
                     player.jail_turns = 0
         elif action == "2":
             if player.pay(50):
-                self.console.print("💸 Paid $50 - Released from jail!")
+                self.console.print(_JAIL_FINE_PAID_MESSAGE)
                 player.jail_turns = 0
             else:
-                self.console.print("❌ Not enough money!")
+                self.console.print(_JAIL_FINE_UNAFFORDABLE_MESSAGE)
         elif action == "3" and player.get_out_of_jail_free_cards > 0:
             player.get_out_of_jail_free_cards -= 1
             player.jail_turns = 0
-            self.console.print("🃏 Used Get Out of Jail Free card - Released!")
+            self.console.print(_JAIL_CARD_USED_MESSAGE)
 
-    def _handle_space_landing(self, player: Player, space: BoardSpace, dice_sum: int):
-        """Handle what happens when a player lands on a space"""
-        if space.space_type == SpaceType.PROPERTY:
-            self._handle_property_landing(player, space.property, dice_sum)
-        elif space.space_type == SpaceType.RAILROAD:
-            self._handle_property_landing(player, space.property, dice_sum)
-        elif space.space_type == SpaceType.UTILITY:
+    def _setup_landing_handlers(self):
+        """Map each actionable space type to its landing handler"""
+
+        def land_on_property(player: Player, space: BoardSpace, dice_sum: int):
             self._handle_property_landing(player, space.property, dice_sum)
-        elif space.space_type == SpaceType.TAX:
+
+        def land_on_tax(player: Player, space: BoardSpace, dice_sum: int):
             self._handle_tax(player, space.tax_amount)
-        elif space.space_type == SpaceType.CHANCE:
+
+        def land_on_chance(player: Player, space: BoardSpace, dice_sum: int):
             self._handle_chance_card(player)
-        elif space.space_type == SpaceType.COMMUNITY_CHEST:
+
+        def land_on_community_chest(player: Player, space: BoardSpace, dice_sum: int):
             self._handle_community_chest_card(player)
-        elif space.space_type == SpaceType.GO_TO_JAIL:
+
+        def land_on_go_to_jail(player: Player, space: BoardSpace, dice_sum: int):
             self._send_to_jail(player)
 
+        self._landing_handlers: Dict[
+            SpaceType, Callable[[Player, BoardSpace, int], None]
+        ] = {
+            SpaceType.PROPERTY: land_on_property,
+            SpaceType.RAILROAD: land_on_property,
+            SpaceType.UTILITY: land_on_property,
+            SpaceType.TAX: land_on_tax,
+            SpaceType.CHANCE: land_on_chance,
+            SpaceType.COMMUNITY_CHEST: land_on_community_chest,
+            SpaceType.GO_TO_JAIL: land_on_go_to_jail,
+        }
+
+    def _setup_card_handlers(self):
+        """Map each Chance and Community Chest card to its effect"""
+
+        def grant_jail_card(player: Player):
+            player.get_out_of_jail_free_cards += 1
+
+        def advance_to(position: int) -> Callable[[Player], None]:
+            return lambda player: self._advance_to(player, position)
+
+        def collect(amount: int) -> Callable[[Player], None]:
+            return lambda player: player.receive(amount)
+
+        def pay_fee(amount: int) -> Callable[[Player], None]:
+            return lambda player: self._pay_card_fee(player, amount)
+
+        def advance_to_nearest_railroad(player: Player):
+            self._advance_to_nearest_railroad(player, double_rent=True)
+
+        self._chance_handlers: Dict[ChanceCard, Callable[[Player], None]] = {
+            ChanceCard.ADVANCE_TO_BOARDWALK: advance_to(39),
+            ChanceCard.ADVANCE_TO_GO: self._advance_to_go,
+            ChanceCard.ADVANCE_TO_ILLINOIS: advance_to(24),
+            ChanceCard.ADVANCE_TO_ST_CHARLES: advance_to(11),
+            ChanceCard.NEAREST_RAILROAD_1: advance_to_nearest_railroad,
+            ChanceCard.NEAREST_RAILROAD_2: advance_to_nearest_railroad,
+            ChanceCard.NEAREST_UTILITY: self._advance_to_nearest_utility,
+            ChanceCard.BANK_DIVIDEND: collect(50),
+            ChanceCard.GET_OUT_OF_JAIL_FREE: grant_jail_card,
+            ChanceCard.GO_BACK_3: self._go_back_three_spaces,
+            ChanceCard.GO_TO_JAIL: self._send_to_jail,
+            ChanceCard.GENERAL_REPAIRS: self._pay_general_repairs,
+            ChanceCard.SPEEDING_FINE: lambda player: player.pay(15),
+            ChanceCard.READING_RAILROAD: advance_to(5),
+            ChanceCard.CHAIRMAN_OF_THE_BOARD: self._pay_chairman_fees,
+            ChanceCard.BUILDING_LOAN: collect(150),
+        }
+
+        self._community_chest_handlers: Dict[
+            CommunityChestCard, Callable[[Player], None]
+        ] = {
+            CommunityChestCard.ADVANCE_TO_GO: self._advance_to_go,
+            CommunityChestCard.BANK_ERROR: collect(200),
+            CommunityChestCard.DOCTORS_FEE: pay_fee(50),
+            CommunityChestCard.STOCK_SALE: collect(50),
+            CommunityChestCard.GET_OUT_OF_JAIL_FREE: grant_jail_card,
+            CommunityChestCard.GO_TO_JAIL: self._send_to_jail,
+            CommunityChestCard.HOLIDAY_FUND: collect(100),
+            CommunityChestCard.INCOME_TAX_REFUND: collect(20),
+            CommunityChestCard.BIRTHDAY: self._collect_birthday_gifts,
+            CommunityChestCard.LIFE_INSURANCE: collect(100),
+            CommunityChestCard.HOSPITAL_FEES: pay_fee(100),
+            CommunityChestCard.SCHOOL_FEES: pay_fee(50),
+            CommunityChestCard.CONSULTANCY_FEE: collect(25),
+            CommunityChestCard.STREET_REPAIRS: self._pay_street_repairs,
+            CommunityChestCard.BEAUTY_CONTEST: collect(10),
+            CommunityChestCard.INHERITANCE: collect(100),
+        }
+
+    def _handle_space_landing(self, player: Player, space: BoardSpace, dice_sum: int):
+        """Handle what happens when a player lands on a space"""
+        handler = self._landing_handlers.get(space.space_type)
+        if handler is not None:
+            handler(player, space, dice_sum)
+
     def _handle_property_landing(
         self, player: Player, property: Property, dice_sum: int
     ):
         """Handle landing on a property, railroad, or utility"""
-        if property.owner is None:
+        owner = property.owner
+        if owner is player:
+            # Landing on your own property costs nothing
+            return
+
+        if owner is None:
             # Property is unowned - offer to buy
             self.console.print(f"💰 {property.name} is available for ${property.price}")
 
@@ -1224,141 +1616,77 @@ class MonopolyGame:
                     f"Buy {property.name} for ${property.price}?", choices=["y", "n"]
                 )
                 if buy.lower() == "y":
-                    player.pay(property.price)
-                    property.owner = player
-                    player.properties.append(property)
+                    player.acquire(property, property.price)
                     self.console.print(f"✅ {player.name} bought {property.name}!")
                 else:
                     # Property goes to auction
                     self._auction_property(property)
             else:
-                self.console.print("❌ Cannot afford this property")
+                self.console.print(_CANNOT_AFFORD_PROPERTY_MESSAGE)
                 self._auction_property(property)
 
-        elif property.owner != player:
+        else:
             # Pay rent to owner
             rent = property.get_rent_amount(dice_sum)
             if rent > 0:
-                self.console.print(f"💸 Pay ${rent} rent to {property.owner.name}")
+                self.console.print(f"💸 Pay ${rent} rent to {owner.name}")
                 if player.pay(rent):
-                    property.owner.receive(rent)
+                    owner.receive(rent)
                 else:
-                    self.console.print("❌ Not enough money to pay rent!")
+                    self.console.print(_CANNOT_PAY_RENT_MESSAGE)
                     self._handle_bankruptcy(player, rent)
 
     def _handle_tax(self, player: Player, amount: int):
         """Handle landing on tax spaces"""
         self.console.print(f"💸 Pay ${amount} tax")
         if not player.pay(amount):
-            self.console.print("❌ Not enough money to pay tax!")
+            self.console.print(_CANNOT_PAY_TAX_MESSAGE)
             # TODO: Handle bankruptcy
 
     def _handle_chance_card(self, player: Player):
         """Handle drawing a Chance card"""
         if not self.chance_cards:
-            self.chance_cards = [
-                "Advance to Boardwalk",
-                "Advance to Go (Collect $200)",
-                "Advance to Illinois Avenue. If you pass Go, collect $200",
-                "Advance to St. Charles Place. If you pass Go, collect $200",
-                "Advance to the nearest Railroad. If unowned, you may buy it from the Bank. If owned, pay owner twice the rental to which they are otherwise entitled",
-                "Advance to the nearest Railroad. If unowned, you may buy it from the Bank. If owned, pay owner twice the rental to which they are otherwise entitled",
-                "Advance token to nearest Utility. If unowned, you may buy it from the Bank. If owned, throw dice and pay owner a total ten times amount thrown",
-                "Bank pays you dividend of $50",
-                "Get Out of Jail Free",
-                "Go Back 3 Spaces",
-                "Go to Jail. Go directly to Jail, do not pass Go, do not collect $200",
-                "Make general repairs on all your property. For each house pay $25. For each hotel pay $100",
-                "Speeding fine $15",
-                "Take a trip to Reading Railroad. If you pass Go, collect $200",
-                "You have been elected Chairman of the Board. Pay each player $50",
-                "Your building loan matures. Collect $150",
-            ]
-            random.shuffle(self.chance_cards)
+            self.chance_cards = _shuffled_deck(_CHANCE_DECK)
 
         card = self.chance_cards.pop()
-        self.console.print(f"🃏 Chance: [italic]{card}[/italic]")
+        self.console.print(f"🃏 Chance: [italic]{_CHANCE_TEXT[card]}[/italic]")
 
-        # Enhanced card implementation
-        if "Get Out of Jail Free" in card:
-            player.get_out_of_jail_free_cards += 1
-        elif "Advance to Go" in card:
-            old_pos = player.position
-            player.position = 0
+        self._chance_handlers[card](player)
+
+    def _advance_to(self, player: Player, position: int):
+        """Move forward to a fixed position, collecting $200 if GO is passed"""
+        old_pos = player.position
+        player.position = position
+        if player.position < old_pos:
             player.receive(200)
-        elif "Advance to Boardwalk" in card:
-            old_pos = player.position
-            player.position = 39  # Boardwalk position
-            space = self.board_spaces[player.position]
-            self._handle_space_landing(player, space, 0)
-        elif "Advance to Illinois Avenue" in card:
-            old_pos = player.position
-            player.position = 24  # Illinois Avenue
-            if player.position < old_pos:
-                player.receive(200)
-            space = self.board_spaces[player.position]
-            self._handle_space_landing(player, space, 0)
-        elif "Advance to St. Charles Place" in card:
-            old_pos = player.position
-            player.position = 11  # St. Charles Place
-            if player.position < old_pos:
-                player.receive(200)
-            space = self.board_spaces[player.position]
-            self._handle_space_landing(player, space, 0)
-        elif "nearest Railroad" in card:
-            self._advance_to_nearest_railroad(player, double_rent=True)
-        elif "nearest Utility" in card:
-            self._advance_to_nearest_utility(player)
-        elif "dividend of $50" in card:
-            player.receive(50)
-        elif "Go Back 3 Spaces" in card:
-            player.position = (player.position - 3) % 40
-            space = self.board_spaces[player.position]
-            self.console.print(f"Moved back to: {space.name}")
-            self._handle_space_landing(player, space, 0)
-        elif "general repairs" in card:
-            cost = sum(
-                25 * prop.houses if prop.houses < 5 else 100
-                for prop in player.properties
-            )
-            player.pay(cost)
-            self.console.print(f"Paid ${cost} in repairs")
-        elif "fine $15" in card:
-            player.pay(15)
-        elif "Chairman of the Board" in card:
-            for other_player in self.players:
-                if other_player != player:
-                    other_player.pay(50)
-                    player.receive(50)
-        elif "building loan matures" in card:
-            player.receive(150)
-        elif "Reading Railroad" in card:
-            old_pos = player.position
-            player.position = 5  # Reading Railroad
-            if player.position < old_pos:
-                player.receive(200)
-            space = self.board_spaces[player.position]
-            self._handle_space_landing(player, space, 0)
-        elif "Go to Jail" in card:
-            self._send_to_jail(player)
+        space = self.board_spaces[player.position]
+        self._handle_space_landing(player, space, 0)
 
-    def _advance_to_nearest_railroad(self, player: Player, double_rent: bool = False):
-        """Advance player to nearest railroad"""
-        railroad_positions = [5, 15, 25, 35]  # Railroad positions
-        current_pos = player.position
+    def _advance_to_go(self, player: Player):
+        player.position = 0
+        player.receive(200)
 
-        # Find next railroad
-        next_railroad = None
-        for pos in railroad_positions:
-            if pos > current_pos:
-                next_railroad = pos
-                break
+    def _go_back_three_spaces(self, player: Player):
+        player.position = (player.position - 3) % 40
+        space = self.board_spaces[player.position]
+        self.console.print(f"Moved back to: {space.name}")
+        self._handle_space_landing(player, space, 0)
+
+    def _pay_general_repairs(self, player: Player):
+        cost = player.repair_cost(25, 100)
+        player.pay(cost)
+        self.console.print(f"Paid ${cost} in repairs")
 
-        if next_railroad is None:
-            next_railroad = railroad_positions[0]  # Wrap around to first railroad
+    def _pay_chairman_fees(self, player: Player):
+        for other_player in self._active_players:
+            if other_player is not player:
+                other_player.pay(50)
+                player.receive(50)
 
+    def _advance_to_nearest_railroad(self, player: Player, double_rent: bool = False):
+        """Advance player to nearest railroad"""
         old_pos = player.position
-        player.position = next_railroad
+        player.position = _NEXT_RAILROAD[old_pos]
 
         if player.position < old_pos:
             player.receive(200)
@@ -1382,21 +1710,8 @@ class MonopolyGame:
 
     def _advance_to_nearest_utility(self, player: Player):
         """Advance player to nearest utility"""
-        utility_positions = [12, 28]  # Electric Company, Water Works
-        current_pos = player.position
-
-        # Find next utility
-        next_utility = None
-        for pos in utility_positions:
-            if pos > current_pos:
-                next_utility = pos
-                break
-
-        if next_utility is None:
-            next_utility = utility_positions[0]  # Wrap around
-
         old_pos = player.position
-        player.position = next_utility
+        player.position = _NEXT_UTILITY[old_pos]
 
         if player.position < old_pos:
             player.receive(200)
@@ -1405,7 +1720,8 @@ class MonopolyGame:
         self.console.print(f"Advanced to: {space.name}")
 
         if space.property and space.property.owner and space.property.owner != player:
-            dice_sum = self.roll_dice()[0] + self.roll_dice()[1]
+            die1, die2 = self.roll_dice()
+            dice_sum = die1 + die2
             rent = dice_sum * 10
             self.console.print(f"🎲 Rolled {dice_sum} for utility rent")
             self.console.print(f"💸 Pay ${rent} rent")
@@ -1417,79 +1733,34 @@ class MonopolyGame:
     def _handle_community_chest_card(self, player: Player):
         """Handle drawing a Community Chest card"""
         if not self.community_chest_cards:
-            self.community_chest_cards = [
-                "Advance to Go (Collect $200)",
-                "Bank error in your favor. Collect $200",
-                "Doctor's fee. Pay $50",
-                "From sale of stock you get $50",
-                "Get Out of Jail Free",
-                "Go to Jail. Go directly to jail, do not pass Go, do not collect $200",
-                "Holiday fund matures. Receive $100",
-                "Income tax refund. Collect $20",
-                "It is your birthday. Collect $10 from every player",
-                "Life insurance matures. Collect $100",
-                "Pay hospital fees of $100",
-                "Pay school fees of $50",
-                "Receive $25 consultancy fee",
-                "You are assessed for street repair. $40 per house. $115 per hotel",
-                "You have won second prize in a beauty contest. Collect $10",
-                "You inherit $100",
-            ]
-            random.shuffle(self.community_chest_cards)
+            self.community_chest_cards = _shuffled_deck(_COMMUNITY_CHEST_DECK)
 
         card = self.community_chest_cards.pop()
-        self.console.print(f"🏛️ Community Chest: [italic]{card}[/italic]")
+        self.console.print(
+            f"🏛️ Community Chest: [italic]{_COMMUNITY_CHEST_TEXT[card]}[/italic]"
+        )
 
-        # Enhanced card implementation
-        if "Get Out of Jail Free" in card:
-            player.get_out_of_jail_free_cards += 1
-        elif "Advance to Go" in card:
-            player.position = 0
-            player.receive(200)
-        elif "Bank error in your favor" in card:
-            player.receive(200)
-        elif "Doctor's fee" in card:
-            if not player.pay(50):
-                self._handle_bankruptcy(player, 50)
-        elif "From sale of stock" in card:
-            player.receive(50)
-        elif "Holiday fund matures" in card:
-            player.receive(100)
-        elif "Income tax refund" in card:
-            player.receive(20)
-        elif "It is your birthday" in card:
-            collected = 0
-            for other_player in self.players:
-                if other_player != player and not other_player.is_bankrupt:
-                    if other_player.pay(10):
-                        collected += 10
-            player.receive(collected)
-            self.console.print(f"Collected ${collected} from other players!")
-        elif "Life insurance matures" in card:
-            player.receive(100)
-        elif "Pay hospital fees" in card:
-            if not player.pay(100):
-                self._handle_bankruptcy(player, 100)
-        elif "Pay school fees" in card:
-            if not player.pay(50):
-                self._handle_bankruptcy(player, 50)
-        elif "consultancy fee" in card:
-            player.receive(25)
-        elif "street repair" in card:
-            cost = sum(
-                40 * prop.houses if prop.houses < 5 else 115
-                for prop in player.properties
-            )
-            if not player.pay(cost):
-                self._handle_bankruptcy(player, cost)
-            else:
-                self.console.print(f"Paid ${cost} for street repairs")
-        elif "beauty contest" in card:
-            player.receive(10)
-        elif "inherit $100" in card:
-            player.receive(100)
-        elif "Go to Jail" in card:
-            self._send_to_jail(player)
+        self._community_chest_handlers[card](player)
+
+    def _pay_card_fee(self, player: Player, amount: int):
+        if not player.pay(amount):
+            self._handle_bankruptcy(player, amount)
+
+    def _collect_birthday_gifts(self, player: Player):
+        collected = 0
+        for other_player in self._active_players:
+            if other_player is not player:
+                if other_player.pay(10):
+                    collected += 10
+        player.receive(collected)
+        self.console.print(f"Collected ${collected} from other players!")
+
+    def _pay_street_repairs(self, player: Player):
+        cost = player.repair_cost(40, 115)
+        if not player.pay(cost):
+            self._handle_bankruptcy(player, cost)
+        else:
+            self.console.print(f"Paid ${cost} for street repairs")
 
     def _handle_bankruptcy(self, player: Player, debt_amount: int):
         """Handle player bankruptcy"""
@@ -1497,7 +1768,9 @@ class MonopolyGame:
 
         # Try to raise money by mortgaging properties
         available_mortgage_value = sum(
-            prop.mortgage_value for prop in player.properties if not prop.is_mortgaged
+            prop.mortgage_value
+            for prop in player.properties
+            if not prop.is_mortgaged
         )
 
         if available_mortgage_value + player.money >= debt_amount:
@@ -1512,30 +1785,28 @@ class MonopolyGame:
         # Player is bankrupt
         self.console.print(f"[red]{player.name} is bankrupt![/red]")
         player.is_bankrupt = True
+        self._active_players = [p for p in self._active_players if p is not player]
 
         # Return properties to bank
-        for prop in player.properties:
-            prop.owner = None
+        for prop in list(player.properties):
+            player.remove_property(prop)
             prop.houses = 0
-            prop.is_mortgaged = False
+            prop.set_mortgaged(False)
 
-        player.properties.clear()
         player.money = 0
 
     def _send_to_jail(self, player: Player):
         """Send player to jail"""
-        self.console.print("🚔 Go to Jail!")
+        self.console.print(_GO_TO_JAIL_MESSAGE)
         player.position = 10  # Jail position
         player.jail_turns = 1
 
     def _check_game_over(self):
         """Check if the game should end"""
-        active_players = [p for p in self.players if not p.is_bankrupt]
-
-        if len(active_players) <= 1:
+        if len(self._active_players) <= 1:
             self.game_over = True
-            if active_players:
-                self.winner = active_players[0]
+            if self._active_players:
+                self.winner = self._active_players[0]
 
 
 def main():
@@ -1637,14 +1908,9 @@ def main():
 
                 console.print(f"🎲 Rolled: {die1} + {die2} = {dice_sum}")
 
-                # Move player
-                old_position = current_player.position
-                current_player.position = (current_player.position + dice_sum) % 40
-
-                # Check if passed GO
-                if current_player.position < old_position:
-                    current_player.receive(200)
-                    console.print("💰 Passed GO! Collect $200")
+                # Move player, collecting $200 for passing GO
+                if game.move_player(current_player, dice_sum):
+                    console.print(_PASSED_GO_MESSAGE)
 
                 current_space = game.board_spaces[current_player.position]
                 console.print(f"📍 Landed on: {current_space.name}")
@@ -1656,9 +1922,9 @@ def main():
                     and current_player.can_afford(current_space.property.price)
                     and current_space.property.price <= 200
                 ):  # Auto-buy cheaper properties
-                    current_player.pay(current_space.property.price)
-                    current_space.property.owner = current_player
-                    current_player.properties.append(current_space.property)
+                    current_player.acquire(
+                        current_space.property, current_space.property.price
+                    )
                     console.print(f"✅ Auto-bought {current_space.property.name}!")
 
                 elif (
@@ -1676,10 +1942,9 @@ def main():
 
                 game.next_turn()
 
-                # Pause for readability in demo
-                import time
-
-                time.sleep(1)
+                # Pause for readability when someone is watching
+                if sys.stdout.isatty():
+                    time.sleep(1)
 
             console.print("\n[yellow]Demo completed![/yellow]")
 
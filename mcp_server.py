@@ -7,10 +7,11 @@ Exposes the Monopoly game through MCP tools so that AI agents can play together.
 
 import json
 import random
-from typing import Dict, List, Optional, Any
+from operator import attrgetter
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from fastmcp import FastMCP
-from main import MonopolyGame, Player, Property, PropertyColor, SpaceType
+from main import _PROPERTIES_DATA, MonopolyGame, Player, Property, PropertyColor, SpaceType
 
 # Global game state (in a real deployment, this would be persistent storage)
 active_games: Dict[str, MonopolyGame] = {}
@@ -52,6 +53,23 @@ def create_game(player_names: List[str]) -> Dict[str, Any]:
     except Exception as e:
         return {"error": f"Failed to create game: {str(e)}"}
 
+# Plain player fields reported by get_game_state, fetched in one call
+_PLAYER_FIELDS = attrgetter("name", "money", "position", "jail_turns", "get_out_of_jail_free_cards")
+
+def _player_info(player: Player) -> Dict[str, Any]:
+    """Describe one player for get_game_state"""
+    name, money, position, jail_turns, jail_cards = _PLAYER_FIELDS(player)
+    return {
+        "name": name,
+        "money": money,
+        "position": position,
+        "in_jail": jail_turns > 0,
+        "jail_turns": jail_turns,
+        "get_out_of_jail_free_cards": jail_cards,
+        "properties": [prop.name for prop in player.properties],
+        "total_wealth": player.total_wealth()
+    }
+
 @mcp.tool()
 def get_game_state(game_id: str) -> Dict[str, Any]:
     """
@@ -69,19 +87,7 @@ def get_game_state(game_id: str) -> Dict[str, Any]:
     game = active_games[game_id]
     
     # Build player information
-    players_info = []
-    for player in game.players:
-        player_info = {
-            "name": player.name,
-            "money": player.money,
-            "position": player.position,
-            "in_jail": player.jail_turns > 0,
-            "jail_turns": player.jail_turns,
-            "get_out_of_jail_free_cards": player.get_out_of_jail_free_cards,
-            "properties": [prop.name for prop in player.properties],
-            "total_wealth": player.total_wealth()
-        }
-        players_info.append(player_info)
+    players_info = list(map(_player_info, game.players))
     
     # Get board space name for current player
     current_player = game.get_current_player()
@@ -99,6 +105,89 @@ def get_game_state(game_id: str) -> Dict[str, Any]:
         "players": players_info
     }
 
+# Response payload shared by the play_turn action handlers
+_Result = Dict[str, Any]
+
+def _execute_move(game: MonopolyGame, current_player: Player, dice_sum: int, result: _Result):
+    """Move the player by the dice, paying for passing GO, and resolve the landing"""
+    if game.move_player(current_player, dice_sum):
+        result["passed_go"] = True
+    
+    # Handle landing on space
+    space = game.board_spaces[current_player.position]
+    result["landed_on"] = space.name
+    try:
+        game._handle_space_landing(current_player, space, dice_sum)
+    except EOFError:
+        # Handle non-interactive mode - just note what happened
+        result["note"] = "Space requires interaction - handled automatically"
+
+def _roll(game: MonopolyGame, current_player: Player, result: _Result) -> Optional[_Result]:
+    """Roll and move, or try to roll doubles out of jail"""
+    dice1, dice2 = game.roll_dice()
+    dice_sum = dice1 + dice2
+    is_doubles = dice1 == dice2
+    result["dice"] = [dice1, dice2]
+    result["doubles"] = is_doubles
+    
+    if current_player.jail_turns > 0:
+        # Handle jail turn
+        if is_doubles:
+            current_player.jail_turns = 0
+            _execute_move(game, current_player, dice_sum, result)
+        else:
+            current_player.jail_turns += 1
+            if current_player.jail_turns >= 3:
+                # Must pay to get out
+                if current_player.can_afford(50):
+                    current_player.pay(50)
+                    current_player.jail_turns = 0
+                    result["forced_jail_payment"] = True
+                else:
+                    result["error"] = "Cannot afford jail fee and no other options"
+    else:
+        # Normal turn
+        _execute_move(game, current_player, dice_sum, result)
+        
+        # Check for doubles
+        if is_doubles and current_player.jail_turns == 0:
+            result["extra_turn"] = True
+        else:
+            game.next_turn()
+    
+    return None
+
+def _pay_jail(game: MonopolyGame, current_player: Player, result: _Result) -> Optional[_Result]:
+    """Pay the $50 fine to leave jail"""
+    if current_player.jail_turns == 0:
+        return {"error": "Player is not in jail"}
+    if not current_player.can_afford(50):
+        return {"error": "Player cannot afford jail fee"}
+    
+    current_player.pay(50)
+    current_player.jail_turns = 0
+    result["paid_jail_fee"] = True
+    return None
+
+def _use_jail_card(game: MonopolyGame, current_player: Player, result: _Result) -> Optional[_Result]:
+    """Leave jail with a Get Out of Jail Free card"""
+    if current_player.jail_turns == 0:
+        return {"error": "Player is not in jail"}
+    if current_player.get_out_of_jail_free_cards <= 0:
+        return {"error": "Player has no Get Out of Jail Free cards"}
+    
+    current_player.get_out_of_jail_free_cards -= 1
+    current_player.jail_turns = 0
+    result["used_jail_card"] = True
+    return None
+
+# play_turn actions; a handler fills in result, or returns an error response
+_TURN_ACTIONS: Dict[str, Callable[[MonopolyGame, Player, _Result], Optional[_Result]]] = {
+    "roll": _roll,
+    "pay_jail": _pay_jail,
+    "use_jail_card": _use_jail_card,
+}
+
 @mcp.tool()
 def play_turn(game_id: str, player_name: str, action: str = "roll") -> Dict[str, Any]:
     """
@@ -125,6 +214,10 @@ def play_turn(game_id: str, player_name: str, action: str = "roll") -> Dict[str,
     if game.game_over:
         return {"error": "Game is already over"}
     
+    handler = _TURN_ACTIONS.get(action)
+    if handler is None:
+        return {"error": f"Unknown action: {action}"}
+    
     # Store initial state for comparison
     initial_money = current_player.money
     initial_position = current_player.position
@@ -132,90 +225,9 @@ def play_turn(game_id: str, player_name: str, action: str = "roll") -> Dict[str,
     result = {"player": player_name, "action": action}
     
     try:
-        if action == "roll":
-            if current_player.jail_turns > 0:
-                # Handle jail turn
-                dice1, dice2 = game.roll_dice()
-                result["dice"] = [dice1, dice2]
-                result["doubles"] = dice1 == dice2
-                
-                if dice1 == dice2:
-                    current_player.jail_turns = 0
-                    # Move player
-                    new_position = (current_player.position + dice1 + dice2) % 40
-                    if new_position < current_player.position:
-                        current_player.receive(200)  # Passed GO
-                        result["passed_go"] = True
-                    current_player.position = new_position
-                    
-                    # Handle landing on space
-                    space = game.board_spaces[current_player.position]
-                    result["landed_on"] = space.name
-                    try:
-                        game._handle_space_landing(current_player, space, dice1 + dice2)
-                    except EOFError:
-                        # Handle non-interactive mode - just note what happened
-                        result["note"] = "Space requires interaction - handled automatically"
-                else:
-                    current_player.jail_turns += 1
-                    if current_player.jail_turns >= 3:
-                        # Must pay to get out
-                        if current_player.can_afford(50):
-                            current_player.pay(50)
-                            current_player.jail_turns = 0
-                            result["forced_jail_payment"] = True
-                        else:
-                            result["error"] = "Cannot afford jail fee and no other options"
-            else:
-                # Normal turn
-                dice1, dice2 = game.roll_dice()
-                result["dice"] = [dice1, dice2]
-                result["doubles"] = dice1 == dice2
-                
-                # Move player
-                new_position = (current_player.position + dice1 + dice2) % 40
-                if new_position < current_player.position:
-                    current_player.receive(200)  # Passed GO
-                    result["passed_go"] = True
-                current_player.position = new_position
-                
-                # Handle landing on space
-                space = game.board_spaces[current_player.position]
-                result["landed_on"] = space.name
-                try:
-                    game._handle_space_landing(current_player, space, dice1 + dice2)
-                except EOFError:
-                    # Handle non-interactive mode - just note what happened
-                    result["note"] = "Space requires interaction - handled automatically"
-                
-                # Check for doubles
-                if dice1 == dice2 and current_player.jail_turns == 0:
-                    result["extra_turn"] = True
-                else:
-                    game.next_turn()
-        
-        elif action == "pay_jail":
-            if current_player.jail_turns == 0:
-                return {"error": "Player is not in jail"}
-            if not current_player.can_afford(50):
-                return {"error": "Player cannot afford jail fee"}
-            
-            current_player.pay(50)
-            current_player.jail_turns = 0
-            result["paid_jail_fee"] = True
-            
-        elif action == "use_jail_card":
-            if current_player.jail_turns == 0:
-                return {"error": "Player is not in jail"}
-            if current_player.get_out_of_jail_free_cards <= 0:
-                return {"error": "Player has no Get Out of Jail Free cards"}
-            
-            current_player.get_out_of_jail_free_cards -= 1
-            current_player.jail_turns = 0
-            result["used_jail_card"] = True
-        
-        else:
-            return {"error": f"Unknown action: {action}"}
+        error = handler(game, current_player, result)
+        if error is not None:
+            return error
         
         # Add financial changes to result
         money_change = current_player.money - initial_money
@@ -230,6 +242,7 @@ def play_turn(game_id: str, player_name: str, action: str = "roll") -> Dict[str,
         
         # Check if game is over
         game._check_game_over()
+        result["next_player"] = game.get_current_player().name
         if game.game_over:
             result["game_over"] = True
             result["winner"] = game.winner.name if game.winner else None
@@ -257,41 +270,32 @@ def buy_property(game_id: str, player_name: str, property_name: str) -> Dict[str
     
     game = active_games[game_id]
     
-    # Find the player
-    player = None
-    for p in game.players:
-        if p.name == player_name:
-            player = p
-            break
-    
+    player = game.players_by_name.get(player_name)
     if not player:
         return {"error": f"Player {player_name} not found"}
     
     # Find the property at player's current position
-    current_space = game.board_spaces[player.position]
-    if current_space.property is None:
+    prop = game.board_spaces[player.position].property
+    if prop is None:
         return {"error": "No property at current location"}
     
-    property = current_space.property
-    if property.name != property_name:
+    if prop.name != property_name:
         return {"error": f"Player is not on {property_name}"}
     
-    if property.owner is not None:
-        return {"error": f"{property_name} is already owned by {property.owner.name}"}
+    if prop.owner is not None:
+        return {"error": f"{property_name} is already owned by {prop.owner.name}"}
     
-    if not player.can_afford(property.price):
-        return {"error": f"Player cannot afford {property_name} (costs ${property.price})"}
+    if not player.can_afford(prop.price):
+        return {"error": f"Player cannot afford {property_name} (costs ${prop.price})"}
     
     # Complete the purchase
-    player.pay(property.price)
-    property.owner = player
-    player.properties.append(property)
+    player.acquire(prop, prop.price)
     
     return {
         "success": True,
         "player": player_name,
         "property": property_name,
-        "price": property.price,
+        "price": prop.price,
         "remaining_money": player.money
     }
 
@@ -312,48 +316,45 @@ def decline_property(game_id: str, player_name: str) -> Dict[str, Any]:
     
     game = active_games[game_id]
     
-    # Find the player
-    player = None
-    for p in game.players:
-        if p.name == player_name:
-            player = p
-            break
-    
+    player = game.players_by_name.get(player_name)
     if not player:
         return {"error": f"Player {player_name} not found"}
     
     # Find the property at player's current position
-    current_space = game.board_spaces[player.position]
-    if current_space.property is None:
+    prop = game.board_spaces[player.position].property
+    if prop is None:
         return {"error": "No property at current location"}
     
-    property = current_space.property
-    if property.owner is not None:
-        return {"error": f"{property.name} is already owned"}
+    if prop.owner is not None:
+        return {"error": f"{prop.name} is already owned"}
     
     # Trigger auction (simplified - just assign to random player for now)
     # In a real implementation, this would be more interactive
-    eligible_players = [p for p in game.players if p.can_afford(1)]
-    if eligible_players:
-        winner = random.choice(eligible_players)
-        auction_price = max(1, property.price // 2)  # Simple auction logic
+    # Pick a uniformly random solvent player in one pass (reservoir of one)
+    winner = None
+    eligible_count = 0
+    for p in game.players:
+        if p.can_afford(1):
+            eligible_count += 1
+            if random.randrange(eligible_count) == 0:
+                winner = p
+    if winner is not None:
+        auction_price = max(1, prop.price // 2)  # Simple auction logic
         
         if winner.can_afford(auction_price):
-            winner.pay(auction_price)
-            property.owner = winner
-            winner.properties.append(property)
+            winner.acquire(prop, auction_price)
             
             return {
                 "auction_held": True,
                 "winner": winner.name,
                 "price": auction_price,
-                "property": property.name
+                "property": prop.name
             }
     
     return {
         "auction_held": True,
         "winner": None,
-        "message": f"No one could afford {property.name} in auction"
+        "message": f"No one could afford {prop.name} in auction"
     }
 
 @mcp.tool()
@@ -373,13 +374,7 @@ def get_player_properties(game_id: str, player_name: str) -> Dict[str, Any]:
     
     game = active_games[game_id]
     
-    # Find the player
-    player = None
-    for p in game.players:
-        if p.name == player_name:
-            player = p
-            break
-    
+    player = game.players_by_name.get(player_name)
     if not player:
         return {"error": f"Player {player_name} not found"}
     
@@ -431,6 +426,32 @@ def list_active_games() -> Dict[str, Any]:
         "total_games": len(games_info)
     }
 
+# Railroads and utilities share fixed terms; MonopolyGame._setup_board sets the same values
+_FIXED_PROPERTY_TERMS = {
+    "railroad": {"color": PropertyColor.RAILROAD.name, "price": 200, "rent_base": 25, "house_cost": 0},
+    "utility": {"color": PropertyColor.UTILITY.name, "price": 150, "rent_base": 0, "house_cost": 0},
+}
+
+def _board_row(position: int, data: Dict[str, Any]) -> Tuple[Dict[str, Any], Optional[Dict[str, Any]]]:
+    """Describe one board space as a (space, property terms or None) pair"""
+    space = {"position": position, "name": data["name"], "type": data["type"].upper()}
+    if data["type"] == "property":
+        terms = {
+            "color": data["color"].name,
+            "price": data["price"],
+            "rent_base": data["rent"][0],
+            "house_cost": data["house_cost"]
+        }
+    else:
+        terms = _FIXED_PROPERTY_TERMS.get(data["type"])
+    return space, terms
+
+# The board layout is the same for every game, so it is described once at import;
+# get_board_info hands out shallow copies of these flat dicts
+_BOARD_ROWS = (({"position": 0, "name": "GO", "type": "GO"}, None),) + tuple(
+    _board_row(i, data) for i, data in enumerate(_PROPERTIES_DATA, 1)
+)
+
 @mcp.tool()
 def get_board_info() -> Dict[str, Any]:
     """
@@ -439,25 +460,12 @@ def get_board_info() -> Dict[str, Any]:
     Returns:
         Dict with board space information
     """
-    # Create a temporary game to get board info
-    temp_game = MonopolyGame(["temp1", "temp2"])
-    
+    # Fresh dicts per call, so a caller mutating its result cannot change later responses
     board_info = []
-    for i, space in enumerate(temp_game.board_spaces):
-        space_info = {
-            "position": i,
-            "name": space.name,
-            "type": space.space_type.name
-        }
-        
-        if space.property:
-            space_info["property"] = {
-                "color": space.property.color.name,
-                "price": space.property.price,
-                "rent_base": space.property.rent_base,
-                "house_cost": space.property.house_cost
-            }
-        
+    for space, terms in _BOARD_ROWS:
+        space_info = space.copy()
+        if terms is not None:
+            space_info["property"] = terms.copy()
         board_info.append(space_info)
     
     return {
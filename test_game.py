@@ -2,7 +2,7 @@
 """Test script for Monopoly game functionality"""
 
 import random
-from main import MonopolyGame, PropertyColor
+from main import ChanceCard, CommunityChestCard, MonopolyGame, PropertyColor
 
 
 def test_basic_game_setup():
@@ -33,8 +33,7 @@ def test_property_rent_calculation():
 
     # Test basic property rent
     mediterranean = game.board_spaces[1].property  # Mediterranean Avenue
-    mediterranean.owner = alice
-    alice.properties.append(mediterranean)
+    alice.add_property(mediterranean)
 
     # Test base rent (no monopoly)
     rent = mediterranean.get_rent_amount()
@@ -42,16 +41,14 @@ def test_property_rent_calculation():
 
     # Test monopoly rent (own both brown properties)
     baltic = game.board_spaces[3].property  # Baltic Avenue
-    baltic.owner = alice
-    alice.properties.append(baltic)
+    alice.add_property(baltic)
 
     rent = mediterranean.get_rent_amount()
     assert rent == 4  # Monopoly rent for Mediterranean
 
     # Test railroad rent
     reading_railroad = game.board_spaces[5].property
-    reading_railroad.owner = alice
-    alice.properties.append(reading_railroad)
+    alice.add_property(reading_railroad)
 
     rent = reading_railroad.get_rent_amount()
     assert rent == 25  # One railroad
@@ -96,17 +93,138 @@ def test_monopoly_detection():
     mediterranean = game.board_spaces[1].property
     baltic = game.board_spaces[3].property
 
-    mediterranean.owner = alice
-    alice.properties.append(mediterranean)
+    alice.add_property(mediterranean)
     assert not alice.owns_monopoly(PropertyColor.BROWN)
 
-    baltic.owner = alice
-    alice.properties.append(baltic)
+    alice.add_property(baltic)
     assert alice.owns_monopoly(PropertyColor.BROWN)
 
     print("✅ Monopoly detection tests passed!")
 
 
+def test_ownership_counters():
+    """Test that ownership counters follow mortgages and transfers"""
+    print("Testing ownership counters...")
+
+    game = MonopolyGame(["Alice", "Bob"])
+    alice, bob = game.players
+
+    mediterranean = game.board_spaces[1].property
+    baltic = game.board_spaces[3].property
+    for prop in (mediterranean, baltic):
+        alice.add_property(prop)
+    assert alice.owns_monopoly(PropertyColor.BROWN)
+
+    # Mortgaging breaks the monopoly, unmortgaging restores it
+    assert mediterranean.get_rent_amount() == 4
+    baltic.set_mortgaged(True)
+    assert not alice.owns_monopoly(PropertyColor.BROWN)
+    assert mediterranean.get_rent_amount() == 2
+    baltic.set_mortgaged(False)
+    assert alice.owns_monopoly(PropertyColor.BROWN)
+    assert mediterranean.get_rent_amount() == 4
+
+    # Railroad rent follows the number of railroads owned
+    reading = game.board_spaces[5].property
+    pennsylvania = game.board_spaces[15].property
+    for prop in (reading, pennsylvania):
+        alice.add_property(prop)
+    assert reading.get_rent_amount() == 50
+
+    alice.remove_property(pennsylvania)
+    assert pennsylvania.owner is None
+    bob.acquire(pennsylvania, 200)
+    assert pennsylvania.owner is bob
+    assert bob.money == 1300
+    assert reading.get_rent_amount() == 25
+    assert pennsylvania.get_rent_amount() == 25
+
+    # Cached net worth follows property transfers
+    assert alice.total_wealth() == alice.money + 60 + 60 + 200
+    assert bob.total_wealth() == bob.money + 200
+
+    # Repair costs follow buildings as houses become a hotel
+    for _ in range(3):
+        alice.add_building(mediterranean)
+    assert alice.repair_cost(25, 100) == 75
+    for _ in range(2):
+        alice.add_building(mediterranean)
+    alice.add_building(baltic)
+    assert alice.repair_cost(25, 100) == 125
+    assert alice.repair_cost(40, 115) == 155
+
+    print("✅ Ownership counter tests passed!")
+
+
+def test_turn_rotation_skips_bankrupt_players():
+    """Test that turns pass over bankrupt players"""
+    print("Testing turn rotation...")
+
+    game = MonopolyGame(["Alice", "Bob", "Carol"])
+    bob = game.players[1]
+    bob.money = 0
+    game._handle_bankruptcy(bob, 100)
+
+    game.next_turn()
+    assert game.get_current_player().name == "Carol"
+    game.next_turn()
+    assert game.get_current_player().name == "Alice"
+
+    print("✅ Turn rotation tests passed!")
+
+
+def test_bankruptcy_ends_game():
+    """Test that the last solvent player wins once the others go bankrupt"""
+    print("Testing bankruptcy...")
+
+    game = MonopolyGame(["Alice", "Bob"])
+    alice, bob = game.players
+    bob.money = 0
+
+    game._handle_bankruptcy(bob, 100)
+    assert bob.is_bankrupt
+    game._check_game_over()
+    assert game.game_over
+    assert game.winner is alice
+
+    print("✅ Bankruptcy tests passed!")
+
+
+def test_one_line_trade_offer():
+    """Test that a one-line trade offer is taken exactly as written or not at all"""
+    print("Testing one-line trade offers...")
+
+    game = MonopolyGame(["Alice", "Bob"])
+    alice, bob = game.players
+
+    mediterranean = game.board_spaces[1].property
+    boardwalk = game.board_spaces[39].property
+    for owner, prop in ((alice, mediterranean), (bob, boardwalk)):
+        owner.add_property(prop)
+
+    offer = game._parse_trade_line("give=1 cash=100 want=1 wantcash=50", alice, bob)
+    assert offer.player1_properties == [mediterranean]
+    assert offer.player1_cash == 100
+    assert offer.player2_properties == [boardwalk]
+    assert offer.player2_cash == 50
+
+    # Any term that cannot be honoured as written rejects the whole line
+    for line in (
+        "cash=100 wantcash=9999",  # more than Bob has
+        "cash=1,000",  # not a single amount
+        "give=1 want=2",  # Bob owns only one property
+        "give=1 give=1",  # repeated term
+        "give=1 swap=2",  # unknown term
+    ):
+        assert game._parse_trade_line(line, alice, bob) is None, line
+
+    # A property with buildings cannot be traded
+    alice.add_building(mediterranean)
+    assert game._parse_trade_line("give=1", alice, bob) is None
+
+    print("✅ One-line trade offer tests passed!")
+
+
 def test_chance_and_community_chest():
     """Test card deck functionality"""
     print("Testing card decks...")
@@ -123,11 +241,15 @@ def test_chance_and_community_chest():
     # Test simple card drawing without triggering interactive prompts
     card = game.chance_cards.pop()
     assert len(game.chance_cards) == original_chance_count - 1
-    assert isinstance(card, str)
+    assert isinstance(card, ChanceCard)
 
     # Test that cards are properly initialized
-    assert any("Get Out of Jail Free" in card for card in game.chance_cards + [card])
-    assert any("Advance to Go" in card for card in game.community_chest_cards)
+    assert ChanceCard.GET_OUT_OF_JAIL_FREE in game.chance_cards + [card]
+    assert CommunityChestCard.ADVANCE_TO_GO in game.community_chest_cards
+
+    # Every card has an effect handler
+    assert set(game._chance_handlers) == set(ChanceCard)
+    assert set(game._community_chest_handlers) == set(CommunityChestCard)
 
     print("✅ Card deck tests passed!")
 
@@ -140,6 +262,10 @@ def run_all_tests():
     test_property_rent_calculation()
     test_player_movement()
     test_monopoly_detection()
+    test_ownership_counters()
+    test_turn_rotation_skips_bankrupt_players()
+    test_bankruptcy_ends_game()
+    test_one_line_trade_offer()
     test_chance_and_community_chest()
 
     print(
@@ -193,9 +319,7 @@ def demo_game_turn():
             and current_space.property.owner is None
             and current_player.can_afford(current_space.property.price)
         ):
-            current_player.pay(current_space.property.price)
-            current_space.property.owner = current_player
-            current_player.properties.append(current_space.property)
+            current_player.acquire(current_space.property, current_space.property.price)
             print(
                 f"Bought {current_space.property.name} for ${current_space.property.price}"
             )
@@ -9,599 +9,453 @@ This test suite provides thorough verification of the Monopoly MCP server:
 - Error handling and edge case testing
 """
 
-import json
+import asyncio
+import io
 import random
-from typing import Dict, List, Any, Optional
-from dataclasses import asdict
+
+import pytest
+
+import mcp_server
+
+# Fixed seed for dice and card decks, so every test replays the same game
+_SEED = 0xC0FFEE
 
 def setup_test_environment():
     """Set up clean test environment"""
-    from mcp_server import active_games, mcp
-    
-    # Clear any existing games
-    active_games.clear()
-    
-    # Reset game counter
-    global game_counter
-    import mcp_server
+    # Clear any existing games and reset the game counter
+    mcp_server.active_games.clear()
     mcp_server.game_counter = 0
-    
-    return mcp
-
-class TestMCPTools:
-    """Unit tests for individual MCP tools"""
-    
-    def __init__(self):
-        self.mcp = setup_test_environment()
-        self.tools = {tool.name: tool for tool in self.mcp.get_tools()}
-        
-    def test_create_game_valid(self):
-        """Test game creation with valid parameters"""
-        print("🧪 Testing create_game with valid parameters...")
-        
-        create_game = self.tools["create_game"]
-        
-        # Test 2 players
-        result = create_game.fn(["Alice", "Bob"])
-        assert "game_id" in result, "Game ID not returned"
-        assert "error" not in result, f"Unexpected error: {result.get('error')}"
-        assert result["players"] == ["Alice", "Bob"], "Player names not correct"
-        
-        # Test 4 players
-        result2 = create_game.fn(["AI1", "AI2", "AI3", "AI4"])
-        assert "game_id" in result2, "Second game not created"
-        assert result2["game_id"] != result["game_id"], "Game IDs should be unique"
-        
-        print("   ✅ Valid game creation works")
-        
-    def test_create_game_invalid(self):
-        """Test game creation with invalid parameters"""
-        print("🧪 Testing create_game with invalid parameters...")
-        
-        create_game = self.tools["create_game"]
-        
-        # Test too few players
-        result = create_game.fn(["Alice"])
-        assert "error" in result, "Should error with 1 player"
-        
-        # Test too many players  
-        result = create_game.fn([f"Player{i}" for i in range(10)])
-        assert "error" in result, "Should error with 10 players"
-        
-        # Test empty list
-        result = create_game.fn([])
-        assert "error" in result, "Should error with no players"
-        
-        print("   ✅ Invalid game creation properly rejected")
-        
-    def test_get_game_state(self):
-        """Test game state retrieval"""
-        print("🧪 Testing get_game_state...")
-        
-        create_game = self.tools["create_game"]
-        get_state = self.tools["get_game_state"]
-        
-        # Create a game first
-        result = create_game.fn(["TestPlayer1", "TestPlayer2"])
-        game_id = result["game_id"]
-        
-        # Test valid game state
-        state = get_state.fn(game_id)
-        assert "error" not in state, f"Unexpected error: {state.get('error')}"
-        assert state["game_id"] == game_id, "Game ID mismatch"
-        assert len(state["players"]) == 2, "Player count incorrect"
-        assert state["current_player"] in ["TestPlayer1", "TestPlayer2"], "Invalid current player"
-        assert state["game_over"] is False, "New game should not be over"
-        
-        # Test invalid game ID
-        invalid_state = get_state.fn("invalid_game_id")
-        assert "error" in invalid_state, "Should error with invalid game ID"
-        
-        print("   ✅ Game state retrieval works")
-        
-    def test_play_turn_basic(self):
-        """Test basic turn playing"""
-        print("🧪 Testing play_turn basic functionality...")
-        
-        create_game = self.tools["create_game"]
-        play_turn = self.tools["play_turn"]
-        get_state = self.tools["get_game_state"]
-        
-        # Create game and get initial state
-        result = create_game.fn(["TurnPlayer1", "TurnPlayer2"])
-        game_id = result["game_id"]
-        
-        initial_state = get_state.fn(game_id)
-        current_player = initial_state["current_player"]
-        initial_position = next(p["position"] for p in initial_state["players"] if p["name"] == current_player)
-        
-        # Play a turn
-        turn_result = play_turn.fn(game_id, current_player, "roll")
-        assert "error" not in turn_result, f"Turn failed: {turn_result.get('error')}"
-        assert "dice" in turn_result, "Dice roll not returned"
-        assert len(turn_result["dice"]) == 2, "Should have 2 dice"
-        assert all(1 <= d <= 6 for d in turn_result["dice"]), "Invalid dice values"
-        
-        # Verify position changed (unless they went to jail or something)
-        final_state = get_state.fn(game_id)
-        final_position = next(p["position"] for p in final_state["players"] if p["name"] == current_player)
-        
-        # Position should change unless special circumstances
-        dice_sum = sum(turn_result["dice"])
-        expected_position = (initial_position + dice_sum) % 40
-        
-        print(f"   Initial: {initial_position}, Dice: {turn_result['dice']}, Expected: {expected_position}, Actual: {final_position}")
-        
-        print("   ✅ Basic turn playing works")
-        
-    def test_property_operations(self):
-        """Test property buying and declining"""
-        print("🧪 Testing property buy/decline operations...")
-        
-        create_game = self.tools["create_game"]
-        play_turn = self.tools["play_turn"]
-        buy_property = self.tools["buy_property"]
-        decline_property = self.tools["decline_property"]
-        get_state = self.tools["get_game_state"]
-        
-        # Create game
-        result = create_game.fn(["PropertyPlayer"])
-        game_id = result["game_id"]
-        
-        # Move player to a property (try multiple turns if needed)
-        for attempt in range(20):  # Maximum attempts to land on property
-            state = get_state.fn(game_id)
-            if state["game_over"]:
+
+    return mcp_server.mcp
+
+@pytest.fixture(scope="module")
+def mcp():
+    """MCP server with a clean game registry, shared by the whole module"""
+    return setup_test_environment()
+
+@pytest.fixture(scope="module")
+def tools(mcp):
+    """Registered MCP tools keyed by name"""
+    return asyncio.run(mcp.get_tools())
+
+@pytest.fixture(autouse=True)
+def _seeded_random():
+    """Reseed before each test so its outcome does not depend on test order"""
+    random.seed(_SEED)
+
+@pytest.fixture(autouse=True)
+def _eof_stdin(monkeypatch):
+    """Answer the buy prompt with EOF, as piped input would, even when output is captured"""
+    monkeypatch.setattr("sys.stdin", io.StringIO(""))
+
+@pytest.fixture(autouse=True)
+def _isolate_games():
+    """Drop the games a test created, leaving other tests' games alone"""
+    existing = set(mcp_server.active_games)
+    yield
+    for game_id in mcp_server.active_games.keys() - existing:
+        del mcp_server.active_games[game_id]
+
+@pytest.fixture
+def fresh_game(tools):
+    """ID of a newly created two-player game (Player1, Player2)"""
+    return tools["create_game"].fn(["Player1", "Player2"])["game_id"]
+
+@pytest.fixture(scope="module")
+def purchasable(tools):
+    """Names of the board spaces that can be bought"""
+    board = tools["get_board_info"].fn()["board_spaces"]
+    return frozenset(space["name"] for space in board if "property" in space)
+
+def _players_by_name(state):
+    """Index the player entries of a get_game_state result by name"""
+    return {p["name"]: p for p in state["players"]}
+
+# Unit tests for individual MCP tools
+
+def test_create_game_valid(tools):
+    """Test game creation with valid parameters"""
+    print("🧪 Testing create_game with valid parameters...")
+
+    create_game = tools["create_game"].fn
+
+    # Test 2 players
+    result = create_game(["Alice", "Bob"])
+    assert "game_id" in result, "Game ID not returned"
+    assert "error" not in result, f"Unexpected error: {result.get('error')}"
+    assert result["players"] == ["Alice", "Bob"], "Player names not correct"
+
+    # Test 4 players
+    result2 = create_game(["AI1", "AI2", "AI3", "AI4"])
+    assert "game_id" in result2, "Second game not created"
+    assert result2["game_id"] != result["game_id"], "Game IDs should be unique"
+
+    print("   ✅ Valid game creation works")
+
+def test_create_game_invalid(tools):
+    """Test game creation with invalid parameters"""
+    print("🧪 Testing create_game with invalid parameters...")
+
+    create_game = tools["create_game"].fn
+
+    # Test too few players
+    result = create_game(["Alice"])
+    assert "error" in result, "Should error with 1 player"
+
+    # Test too many players
+    result = create_game([f"Player{i}" for i in range(10)])
+    assert "error" in result, "Should error with 10 players"
+
+    # Test empty list
+    result = create_game([])
+    assert "error" in result, "Should error with no players"
+
+    print("   ✅ Invalid game creation properly rejected")
+
+def test_get_game_state(tools, fresh_game):
+    """Test game state retrieval"""
+    print("🧪 Testing get_game_state...")
+
+    get_state = tools["get_game_state"].fn
+    game_id = fresh_game
+
+    # Test valid game state
+    state = get_state(game_id)
+    assert "error" not in state, f"Unexpected error: {state.get('error')}"
+    assert state["game_id"] == game_id, "Game ID mismatch"
+    assert len(state["players"]) == 2, "Player count incorrect"
+    assert state["current_player"] in ["Player1", "Player2"], "Invalid current player"
+    assert state["game_over"] is False, "New game should not be over"
+
+    # Test invalid game ID
+    invalid_state = get_state("invalid_game_id")
+    assert "error" in invalid_state, "Should error with invalid game ID"
+
+    print("   ✅ Game state retrieval works")
+
+def test_play_turn_basic(tools, fresh_game):
+    """Test basic turn playing"""
+    print("🧪 Testing play_turn basic functionality...")
+
+    play_turn = tools["play_turn"].fn
+    get_state = tools["get_game_state"].fn
+    game_id = fresh_game
+
+    initial_state = get_state(game_id)
+    current_player = initial_state["current_player"]
+    initial_position = _players_by_name(initial_state)[current_player]["position"]
+
+    # Play a turn
+    turn_result = play_turn(game_id, current_player, "roll")
+    assert "error" not in turn_result, f"Turn failed: {turn_result.get('error')}"
+    assert "dice" in turn_result, "Dice roll not returned"
+    assert len(turn_result["dice"]) == 2, "Should have 2 dice"
+    assert all(1 <= d <= 6 for d in turn_result["dice"]), "Invalid dice values"
+
+    # The player moves by the dice total, unless the landing sent them to jail
+    final_state = get_state(game_id)
+    final_player = _players_by_name(final_state)[current_player]
+    final_position = final_player["position"]
+
+    dice_sum = sum(turn_result["dice"])
+    expected_position = (initial_position + dice_sum) % 40
+
+    print(f"   Initial: {initial_position}, Dice: {turn_result['dice']}, Expected: {expected_position}, Actual: {final_position}")
+    if final_player["in_jail"]:
+        assert final_position == 10, f"Jailed player not on the jail space: {final_position}"
+    else:
+        assert final_position == expected_position, f"Expected position {expected_position}, got {final_position}"
+
+    print("   ✅ Basic turn playing works")
+
+def test_property_operations(tools, fresh_game, purchasable):
+    """Test property buying and declining"""
+    print("🧪 Testing property buy/decline operations...")
+
+    play_turn = tools["play_turn"].fn
+    buy_property = tools["buy_property"].fn
+    decline_property = tools["decline_property"].fn
+    get_state = tools["get_game_state"].fn
+    game_id = fresh_game
+
+    # Move player to a property (try multiple turns if needed)
+    for attempt in range(20):  # Maximum attempts to land on property
+        state = get_state(game_id)
+        if state["game_over"]:
+            break
+
+        current_player = state["current_player"]
+
+        # Play turn
+        turn_result = play_turn(game_id, current_player, "roll")
+        assert "error" not in turn_result, f"Turn failed: {turn_result['error']}"
+
+        # Check if landed on a purchasable property
+        if turn_result.get("landed_on") in purchasable:
+            landed_space = turn_result["landed_on"]
+
+            # Try to buy it
+            buy_result = buy_property(game_id, current_player, landed_space)
+
+            if "success" in buy_result and buy_result["success"]:
+                print(f"   ✅ Successfully bought {landed_space}")
+
+                # Verify property is owned
+                updated_state = get_state(game_id)
+                player_data = _players_by_name(updated_state)[current_player]
+                assert landed_space in player_data["properties"], "Property not in player inventory"
                 break
-                
-            current_player = state["current_player"]
-            current_pos = next(p["position"] for p in state["players"] if p["name"] == current_player)
-            
-            # Play turn
-            turn_result = play_turn.fn(game_id, current_player, "roll")
-            if "error" in turn_result:
-                continue
-                
-            # Check if landed on a purchasable property
-            if "landed_on" in turn_result:
-                landed_space = turn_result["landed_on"]
-                
-                # Try to buy it
-                buy_result = buy_property.fn(game_id, current_player, landed_space)
-                
-                if "success" in buy_result and buy_result["success"]:
-                    print(f"   ✅ Successfully bought {landed_space}")
-                    
-                    # Verify property is owned
-                    updated_state = get_state.fn(game_id)
-                    player_data = next(p for p in updated_state["players"] if p["name"] == current_player)
-                    assert landed_space in player_data["properties"], "Property not in player inventory"
+
+            elif "error" in buy_result:
+                # Try to decline instead
+                decline_result = decline_property(game_id, current_player)
+                if "auction_held" in decline_result:
+                    print(f"   ✅ Property {landed_space} went to auction")
                     break
-                    
-                elif "error" in buy_result:
-                    # Try to decline instead
-                    decline_result = decline_property.fn(game_id, current_player)
-                    if "auction_held" in decline_result:
-                        print(f"   ✅ Property {landed_space} went to auction")
-                        break
-        
-        print("   ✅ Property operations work")
-
-class TestMCPIntegration:
-    """Integration tests for complete gameplay scenarios"""
-    
-    def __init__(self):
-        self.mcp = setup_test_environment()
-        self.tools = {tool.name: tool for tool in self.mcp.get_tools()}
-        
-    def test_complete_game_flow(self):
-        """Test a complete game from start to finish"""
-        print("🧪 Testing complete game flow...")
-        
-        create_game = self.tools["create_game"]
-        get_state = self.tools["get_game_state"]
-        play_turn = self.tools["play_turn"]
-        buy_property = self.tools["buy_property"]
-        decline_property = self.tools["decline_property"]
-        
-        # Create 2-player game
-        result = create_game.fn(["IntegrationAI1", "IntegrationAI2"])
-        game_id = result["game_id"]
-        
-        print(f"   Created game: {game_id}")
-        
-        # Play multiple rounds
-        max_turns = 50
-        property_purchases = 0
-        turn_count = 0
-        
-        for turn in range(max_turns):
-            state = get_state.fn(game_id)
-            
-            if state["game_over"]:
-                print(f"   Game ended after {turn} turns. Winner: {state.get('winner', 'None')}")
-                break
-                
-            current_player = state["current_player"]
-            player_data = next(p for p in state["players"] if p["name"] == current_player)
-            
-            # Play turn
-            turn_result = play_turn.fn(game_id, current_player, "roll")
-            
-            if "error" in turn_result:
-                print(f"   Turn error: {turn_result['error']}")
-                continue
-                
-            turn_count += 1
-            
-            # Handle property purchases with simple strategy
-            if "landed_on" in turn_result and player_data["money"] > 300:
-                buy_result = buy_property.fn(game_id, current_player, turn_result["landed_on"])
-                
-                if "success" in buy_result and buy_result["success"]:
-                    property_purchases += 1
-                    print(f"   Turn {turn}: {current_player} bought {turn_result['landed_on']}")
-                elif "error" in buy_result and "not a property" not in buy_result["error"]:
-                    decline_property.fn(game_id, current_player)
-        
-        # Verify game progression
-        final_state = get_state.fn(game_id)
-        assert turn_count > 0, "No turns were played"
-        
-        print(f"   ✅ Completed {turn_count} turns with {property_purchases} property purchases")
-        
-    def test_multi_game_management(self):
-        """Test managing multiple concurrent games"""
-        print("🧪 Testing multiple game management...")
-        
-        create_game = self.tools["create_game"]
-        list_games = self.tools["list_active_games"]
-        get_state = self.tools["get_game_state"]
-        
-        # Create multiple games
-        game_ids = []
-        for i in range(3):
-            result = create_game.fn([f"MultiPlayer{i}_1", f"MultiPlayer{i}_2"])
-            assert "game_id" in result, f"Failed to create game {i}"
-            game_ids.append(result["game_id"])
-        
-        # Verify all games exist
-        games_list = list_games.fn()
-        assert games_list["total_games"] >= 3, f"Expected at least 3 games, got {games_list['total_games']}"
-        
-        # Verify each game is accessible
-        for game_id in game_ids:
-            state = get_state.fn(game_id)
-            assert "error" not in state, f"Game {game_id} not accessible"
-            assert state["game_id"] == game_id, "Game ID mismatch"
-        
-        print(f"   ✅ Successfully managed {len(game_ids)} concurrent games")
-        
-    def test_game_state_consistency(self):
-        """Test that game state remains consistent across operations"""
-        print("🧪 Testing game state consistency...")
-        
-        create_game = self.tools["create_game"]
-        get_state = self.tools["get_game_state"]
-        play_turn = self.tools["play_turn"]
-        get_properties = self.tools["get_player_properties"]
-        
-        # Create game
-        result = create_game.fn(["ConsistencyTest1", "ConsistencyTest2"])
-        game_id = result["game_id"]
-        
-        # Play several turns and verify consistency
-        for turn in range(10):
-            # Get state before turn
-            before_state = get_state.fn(game_id)
-            if before_state["game_over"]:
-                break
-                
-            current_player = before_state["current_player"]
-            before_money = next(p["money"] for p in before_state["players"] if p["name"] == current_player)
-            before_position = next(p["position"] for p in before_state["players"] if p["name"] == current_player)
-            
-            # Play turn
-            turn_result = play_turn.fn(game_id, current_player, "roll")
-            if "error" in turn_result:
-                continue
-            
-            # Get state after turn  
-            after_state = get_state.fn(game_id)
-            after_money = next(p["money"] for p in after_state["players"] if p["name"] == current_player)
-            after_position = next(p["position"] for p in after_state["players"] if p["name"] == current_player)
-            
-            # Verify consistency
-            if "money_change" in turn_result:
-                expected_money = before_money + turn_result["money_change"]
-                assert after_money == expected_money, f"Money inconsistency: expected {expected_money}, got {after_money}"
-            
-            # Verify properties are consistent with game state
-            props = get_properties.fn(game_id, current_player)
-            player_props_from_state = next(p["properties"] for p in after_state["players"] if p["name"] == current_player)
-            props_from_tool = [p["name"] for p in props["properties"]]
-            
-            assert set(player_props_from_state) == set(props_from_tool), "Property lists inconsistent"
-        
-        print("   ✅ Game state consistency maintained")
-
-class TestMCPErrorHandling:
-    """Test error handling and edge cases"""
-    
-    def __init__(self):
-        self.mcp = setup_test_environment()
-        self.tools = {tool.name: tool for tool in self.mcp.get_tools()}
-        
-    def test_invalid_game_operations(self):
-        """Test operations on non-existent games"""
-        print("🧪 Testing invalid game operations...")
-        
-        get_state = self.tools["get_game_state"]
-        play_turn = self.tools["play_turn"]
-        buy_property = self.tools["buy_property"]
-        get_properties = self.tools["get_player_properties"]
-        
-        fake_game_id = "nonexistent_game"
-        
-        # All operations should fail gracefully
-        operations = [
-            (get_state, (fake_game_id,)),
-            (play_turn, (fake_game_id, "FakePlayer", "roll")),
-            (buy_property, (fake_game_id, "FakePlayer", "Boardwalk")),
-            (get_properties, (fake_game_id, "FakePlayer"))
-        ]
-        
-        for operation, args in operations:
-            result = operation.fn(*args)
-            assert "error" in result, f"Operation {operation.__name__} should have failed"
-            assert "not found" in result["error"].lower(), f"Error message unclear: {result['error']}"
-        
-        print("   ✅ Invalid game operations handled correctly")
-        
-    def test_wrong_player_turn(self):
-        """Test playing turns for wrong players"""
-        print("🧪 Testing wrong player turn handling...")
-        
-        create_game = self.tools["create_game"]
-        get_state = self.tools["get_game_state"]
-        play_turn = self.tools["play_turn"]
-        
-        # Create game
-        result = create_game.fn(["WrongPlayer1", "WrongPlayer2"])
-        game_id = result["game_id"]
-        
-        # Get current player
-        state = get_state.fn(game_id)
+
+    print("   ✅ Property operations work")
+
+# Integration tests for complete gameplay scenarios
+
+def test_complete_game_flow(tools, fresh_game, purchasable):
+    """Test a complete game from start to finish"""
+    print("🧪 Testing complete game flow...")
+
+    get_state = tools["get_game_state"].fn
+    play_turn = tools["play_turn"].fn
+    buy_property = tools["buy_property"].fn
+    decline_property = tools["decline_property"].fn
+    game_id = fresh_game
+
+    print(f"   Created game: {game_id}")
+
+    # Play multiple rounds
+    max_turns = 50
+    property_purchases = 0
+    turn_count = 0
+
+    for turn in range(max_turns):
+        state = get_state(game_id)
         current_player = state["current_player"]
-        wrong_player = "WrongPlayer1" if current_player == "WrongPlayer2" else "WrongPlayer2"
-        
-        # Try to play turn with wrong player
-        result = play_turn.fn(game_id, wrong_player, "roll")
-        assert "error" in result, "Should error when wrong player tries to play"
-        assert "not" in result["error"].lower() and "turn" in result["error"].lower(), f"Error message unclear: {result['error']}"
-        
-        print("   ✅ Wrong player turn attempts handled correctly")
-        
-    def test_invalid_property_operations(self):
-        """Test invalid property operations"""
-        print("🧪 Testing invalid property operations...")
-        
-        create_game = self.tools["create_game"]
-        buy_property = self.tools["buy_property"]
-        decline_property = self.tools["decline_property"]
-        
-        # Create game
-        result = create_game.fn(["PropTestPlayer"])
-        game_id = result["game_id"]
-        
-        # Try to buy property when not on it
-        buy_result = buy_property.fn(game_id, "PropTestPlayer", "Boardwalk")
-        assert "error" in buy_result, "Should error when not on property"
-        
-        # Try to decline property when not on it
-        decline_result = decline_property.fn(game_id, "PropTestPlayer")
-        assert "error" in decline_result, "Should error when not on purchasable property"
-        
-        print("   ✅ Invalid property operations handled correctly")
-
-class TestMCPPropertyBased:
-    """Property-based tests for game invariants"""
-    
-    def __init__(self):
-        self.mcp = setup_test_environment()
-        self.tools = {tool.name: tool for tool in self.mcp.get_tools()}
-        
-    def test_money_conservation(self):
-        """Test that money is conserved in the system"""
-        print("🧪 Testing money conservation...")
-        
-        create_game = self.tools["create_game"]
-        get_state = self.tools["get_game_state"]
-        play_turn = self.tools["play_turn"]
-        
-        # Create game
-        result = create_game.fn(["MoneyTest1", "MoneyTest2"])
-        game_id = result["game_id"]
-        
-        # Get initial total money
-        initial_state = get_state.fn(game_id)
-        initial_total = sum(p["money"] for p in initial_state["players"])
-        
-        # Play several turns
-        for turn in range(15):
-            state = get_state.fn(game_id)
-            if state["game_over"]:
-                break
-                
-            current_player = state["current_player"]
-            turn_result = play_turn.fn(game_id, current_player, "roll")
-            
-            if "error" not in turn_result:
-                # Check money conservation after each turn
-                new_state = get_state.fn(game_id)
-                current_total = sum(p["money"] for p in new_state["players"])
-                
-                # Money should only increase (from passing GO, cards, etc.) or stay same
-                # Never decrease except for property purchases or payments between players
-                # For now, just check it's reasonable
-                assert current_total >= 0, f"Negative total money: {current_total}"
-                assert current_total <= initial_total + 5000, f"Money increased too much: {current_total}"
-        
-        print("   ✅ Money conservation looks reasonable")
-        
-    def test_position_bounds(self):
-        """Test that player positions stay within board bounds"""
-        print("🧪 Testing position bounds...")
-        
-        create_game = self.tools["create_game"]
-        get_state = self.tools["get_game_state"]
-        play_turn = self.tools["play_turn"]
-        
-        # Create game
-        result = create_game.fn(["PositionTest"])
-        game_id = result["game_id"]
-        
-        # Play many turns and check positions
-        for turn in range(30):
-            state = get_state.fn(game_id)
-            if state["game_over"]:
-                break
-                
-            # Verify all positions are valid
-            for player in state["players"]:
-                position = player["position"]
-                assert 0 <= position < 40, f"Invalid position {position} for player {player['name']}"
-            
-            # Play turn
-            current_player = state["current_player"]
-            play_turn.fn(game_id, current_player, "roll")
-        
-        print("   ✅ Player positions stay within bounds")
-        
-    def test_game_state_invariants(self):
-        """Test that game state invariants are maintained"""
-        print("🧪 Testing game state invariants...")
-        
-        create_game = self.tools["create_game"]
-        get_state = self.tools["get_game_state"]
-        play_turn = self.tools["play_turn"]
-        
-        # Create game
-        result = create_game.fn(["InvariantTest1", "InvariantTest2"])
-        game_id = result["game_id"]
-        
-        # Play turns and check invariants
-        for turn in range(20):
-            state = get_state.fn(game_id)
-            if state["game_over"]:
-                break
-            
-            # Check invariants
-            assert len(state["players"]) == 2, "Player count changed"
-            assert state["current_player"] in [p["name"] for p in state["players"]], "Invalid current player"
-            assert 0 <= state["houses_remaining"] <= 32, f"Invalid houses remaining: {state['houses_remaining']}"
-            assert 0 <= state["hotels_remaining"] <= 12, f"Invalid hotels remaining: {state['hotels_remaining']}"
-            
-            # Each player should have valid data
-            for player in state["players"]:
-                assert player["money"] >= 0, f"Player {player['name']} has negative money"
-                assert 0 <= player["position"] < 40, f"Player {player['name']} has invalid position"
-                assert player["jail_turns"] >= 0, f"Player {player['name']} has negative jail turns"
-                assert isinstance(player["properties"], list), f"Player {player['name']} properties not a list"
-            
-            # Play turn
-            current_player = state["current_player"]
-            play_turn.fn(game_id, current_player, "roll")
-        
-        print("   ✅ Game state invariants maintained")
-
-def run_comprehensive_tests():
-    """Run all comprehensive tests"""
-    print("🎲 Running Comprehensive MCP Server Tests")
-    print("=" * 60)
-    
-    test_results = []
-    
-    try:
-        # Unit Tests
-        print("\n📝 UNIT TESTS")
-        print("-" * 30)
-        unit_tests = TestMCPTools()
-        unit_tests.test_create_game_valid()
-        unit_tests.test_create_game_invalid() 
-        unit_tests.test_get_game_state()
-        unit_tests.test_play_turn_basic()
-        unit_tests.test_property_operations()
-        test_results.append(("Unit Tests", "✅ PASSED"))
-        
-    except Exception as e:
-        test_results.append(("Unit Tests", f"❌ FAILED: {str(e)}"))
-        
-    try:
-        # Integration Tests
-        print("\n🔗 INTEGRATION TESTS")
-        print("-" * 30)
-        integration_tests = TestMCPIntegration()
-        integration_tests.test_complete_game_flow()
-        integration_tests.test_multi_game_management()
-        integration_tests.test_game_state_consistency()
-        test_results.append(("Integration Tests", "✅ PASSED"))
-        
-    except Exception as e:
-        test_results.append(("Integration Tests", f"❌ FAILED: {str(e)}"))
-        
-    try:
-        # Error Handling Tests
-        print("\n🚨 ERROR HANDLING TESTS")
-        print("-" * 30)
-        error_tests = TestMCPErrorHandling()
-        error_tests.test_invalid_game_operations()
-        error_tests.test_wrong_player_turn()
-        error_tests.test_invalid_property_operations()
-        test_results.append(("Error Handling Tests", "✅ PASSED"))
-        
-    except Exception as e:
-        test_results.append(("Error Handling Tests", f"❌ FAILED: {str(e)}"))
-        
-    try:
-        # Property-Based Tests
-        print("\n🔬 PROPERTY-BASED TESTS")
-        print("-" * 30)
-        property_tests = TestMCPPropertyBased()
-        property_tests.test_money_conservation()
-        property_tests.test_position_bounds()
-        property_tests.test_game_state_invariants()
-        test_results.append(("Property-Based Tests", "✅ PASSED"))
-        
-    except Exception as e:
-        test_results.append(("Property-Based Tests", f"❌ FAILED: {str(e)}"))
-    
-    # Summary
-    print("\n" + "=" * 60)
-    print("📊 TEST RESULTS SUMMARY")
-    print("=" * 60)
-    
-    passed = failed = 0
-    for test_suite, result in test_results:
-        print(f"{test_suite:.<40} {result}")
-        if "PASSED" in result:
-            passed += 1
-        else:
-            failed += 1
-    
-    print("-" * 60)
-    print(f"Total: {len(test_results)} test suites")
-    print(f"✅ Passed: {passed}")
-    print(f"❌ Failed: {failed}")
-    
-    if failed == 0:
-        print("\n🎉 ALL TESTS PASSED!")
-        print("The MCP server is fully verified and production ready.")
-        return True
-    else:
-        print(f"\n⚠️  {failed} test suite(s) failed. Please check the errors above.")
-        return False
+        player_data = _players_by_name(state)[current_player]
+
+        # Play turn
+        turn_result = play_turn(game_id, current_player, "roll")
+
+        assert "error" not in turn_result, f"Turn failed: {turn_result['error']}"
+
+        turn_count += 1
+
+        # play_turn reports the end of the game itself, so stop without
+        # fetching the final state
+        if turn_result.get("game_over"):
+            print(f"   Game ended after {turn_count} turns. Winner: {turn_result['winner']}")
+            break
+
+        # Handle property purchases with simple strategy
+        if turn_result.get("landed_on") in purchasable and player_data["money"] > 300:
+            buy_result = buy_property(game_id, current_player, turn_result["landed_on"])
+
+            if "success" in buy_result and buy_result["success"]:
+                property_purchases += 1
+                print(f"   Turn {turn}: {current_player} bought {turn_result['landed_on']}")
+            elif "error" in buy_result:
+                decline_property(game_id, current_player)
+
+    # Verify game progression
+    assert turn_count > 0, "No turns were played"
+
+    print(f"   ✅ Completed {turn_count} turns with {property_purchases} property purchases")
+
+def test_multi_game_management(tools):
+    """Test managing multiple concurrent games"""
+    print("🧪 Testing multiple game management...")
+
+    create_game = tools["create_game"].fn
+    list_games = tools["list_active_games"].fn
+    get_state = tools["get_game_state"].fn
+
+    # Create multiple games
+    game_ids = []
+    for i in range(3):
+        result = create_game([f"MultiPlayer{i}_1", f"MultiPlayer{i}_2"])
+        assert "game_id" in result, f"Failed to create game {i}"
+        game_ids.append(result["game_id"])
+
+    # Verify all games exist
+    games_list = list_games()
+    assert games_list["total_games"] >= 3, f"Expected at least 3 games, got {games_list['total_games']}"
+
+    # Verify each game is accessible
+    for game_id in game_ids:
+        state = get_state(game_id)
+        assert "error" not in state, f"Game {game_id} not accessible"
+        assert state["game_id"] == game_id, "Game ID mismatch"
+
+    print(f"   ✅ Successfully managed {len(game_ids)} concurrent games")
+
+def test_game_state_consistency(tools, fresh_game):
+    """Test that game state remains consistent across operations"""
+    print("🧪 Testing game state consistency...")
+
+    get_state = tools["get_game_state"].fn
+    play_turn = tools["play_turn"].fn
+    get_properties = tools["get_player_properties"].fn
+    game_id = fresh_game
+
+    # Play several turns and verify consistency; each turn's after-state is
+    # the next turn's before-state, so the state is fetched once per turn
+    before_state = get_state(game_id)
+    before_players = _players_by_name(before_state)
+    for turn in range(10):
+        if before_state["game_over"]:
+            break
+
+        current_player = before_state["current_player"]
+        before_money = before_players[current_player]["money"]
+
+        # Play turn
+        turn_result = play_turn(game_id, current_player, "roll")
+        assert "error" not in turn_result, f"Turn failed: {turn_result['error']}"
+        after_state = get_state(game_id)
+        after_players = _players_by_name(after_state)
+
+        after_player = after_players[current_player]
+        after_money = after_player["money"]
+
+        # Verify consistency
+        if "money_change" in turn_result:
+            expected_money = before_money + turn_result["money_change"]
+            assert after_money == expected_money, f"Money inconsistency: expected {expected_money}, got {after_money}"
+
+        # Verify properties are consistent with game state
+        props = get_properties(game_id, current_player)
+        player_props_from_state = after_player["properties"]
+        props_from_tool = {p["name"] for p in props["properties"]}
+
+        assert set(player_props_from_state) == props_from_tool, "Property lists inconsistent"
+
+        before_state, before_players = after_state, after_players
+
+    print("   ✅ Game state consistency maintained")
+
+# Error handling and edge cases
+
+def test_invalid_game_operations(tools):
+    """Test operations on non-existent games"""
+    print("🧪 Testing invalid game operations...")
+
+    get_state = tools["get_game_state"]
+    play_turn = tools["play_turn"]
+    buy_property = tools["buy_property"]
+    get_properties = tools["get_player_properties"]
+
+    fake_game_id = "nonexistent_game"
+
+    # All operations should fail gracefully
+    operations = [
+        (get_state, (fake_game_id,)),
+        (play_turn, (fake_game_id, "FakePlayer", "roll")),
+        (buy_property, (fake_game_id, "FakePlayer", "Boardwalk")),
+        (get_properties, (fake_game_id, "FakePlayer"))
+    ]
+
+    for operation, args in operations:
+        result = operation.fn(*args)
+        assert "error" in result, f"Operation {operation.name} should have failed"
+        assert "not found" in result["error"].lower(), f"Error message unclear: {result['error']}"
+
+    print("   ✅ Invalid game operations handled correctly")
+
+def test_wrong_player_turn(tools, fresh_game):
+    """Test playing turns for wrong players"""
+    print("🧪 Testing wrong player turn handling...")
+
+    get_state = tools["get_game_state"].fn
+    play_turn = tools["play_turn"].fn
+    game_id = fresh_game
+
+    # Get current player
+    state = get_state(game_id)
+    current_player = state["current_player"]
+    wrong_player = "Player1" if current_player == "Player2" else "Player2"
+
+    # Try to play turn with wrong player
+    result = play_turn(game_id, wrong_player, "roll")
+    assert "error" in result, "Should error when wrong player tries to play"
+    assert "not" in result["error"].lower() and "turn" in result["error"].lower(), f"Error message unclear: {result['error']}"
+
+    print("   ✅ Wrong player turn attempts handled correctly")
+
+def test_invalid_property_operations(tools, fresh_game):
+    """Test invalid property operations"""
+    print("🧪 Testing invalid property operations...")
+
+    buy_property = tools["buy_property"].fn
+    decline_property = tools["decline_property"].fn
+    game_id = fresh_game
+
+    # Try to buy property when not on it
+    buy_result = buy_property(game_id, "Player1", "Boardwalk")
+    assert "error" in buy_result, "Should error when not on property"
+
+    # Try to decline property when not on it
+    decline_result = decline_property(game_id, "Player1")
+    assert "error" in decline_result, "Should error when not on purchasable property"
+
+    print("   ✅ Invalid property operations handled correctly")
+
+# Property-based tests for game invariants
+
+def _assert_invariants(state, initial_total):
+    """Check the position, money and bank invariants of one game state"""
+    assert len(state["players"]) == 2, "Player count changed"
+    assert state["current_player"] in [p["name"] for p in state["players"]], "Invalid current player"
+    assert 0 <= state["houses_remaining"] <= 32, f"Invalid houses remaining: {state['houses_remaining']}"
+    assert 0 <= state["hotels_remaining"] <= 12, f"Invalid hotels remaining: {state['hotels_remaining']}"
+
+    # Each player should have valid data
+    for player in state["players"]:
+        assert player["money"] >= 0, f"Player {player['name']} has negative money"
+        assert 0 <= player["position"] < 40, f"Invalid position {player['position']} for player {player['name']}"
+        assert player["jail_turns"] >= 0, f"Player {player['name']} has negative jail turns"
+        assert isinstance(player["properties"], list), f"Player {player['name']} properties not a list"
+
+    # Money only enters the game from the bank (passing GO, cards, etc.),
+    # so the total should stay within a reasonable bound
+    current_total = sum(p["money"] for p in state["players"])
+    assert current_total >= 0, f"Negative total money: {current_total}"
+    assert current_total <= initial_total + 5000, f"Money increased too much: {current_total}"
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_game_invariants(tools, seed):
+    """Test that positions, money and game state invariants hold every turn"""
+    print(f"🧪 Testing game invariants (seed {seed})...")
+
+    create_game = tools["create_game"].fn
+    get_state = tools["get_game_state"].fn
+    play_turn = tools["play_turn"].fn
+
+    # Seed before creating the game so the deck shuffles vary with it too
+    random.seed(seed)
+    game_id = create_game(["Player1", "Player2"])["game_id"]
+
+    state = get_state(game_id)
+    initial_total = sum(p["money"] for p in state["players"])
+
+    # One game checks every invariant on each turn's state
+    for turn in range(30):
+        if state["game_over"]:
+            break
+        _assert_invariants(state, initial_total)
+
+        play_turn(game_id, state["current_player"], "roll")
+        state = get_state(game_id)
+
+    # The state after the last turn is checked too
+    _assert_invariants(state, initial_total)
+
+    print("   ✅ Game invariants maintained")
 
 if __name__ == "__main__":
-    success = run_comprehensive_tests()
-    exit(0 if success else 1)
\ No newline at end of file
+    raise SystemExit(pytest.main([__file__, "-s"]))
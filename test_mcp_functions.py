@@ -6,24 +6,44 @@ Direct testing of the MCP tool functions without the MCP framework complexity.
 This provides comprehensive verification of all game logic exposed through MCP tools.
 """
 
+import io
+import random
 import sys
+import time
 import traceback
-import random
+
+import pytest
+
+import mcp_server
+
+# Fixed seed for dice and card decks, so every run replays the same games
+_SEED = 42
 
 def reset_test_environment():
     """Reset the test environment for clean testing"""
-    import mcp_server
     mcp_server.active_games.clear()
     mcp_server.game_counter = 0
+    random.seed(_SEED)
+
+@pytest.fixture(autouse=True)
+def _clean_environment():
+    """Give every test an empty game registry so tests can run in any order"""
+    reset_test_environment()
+
+@pytest.fixture(autouse=True)
+def _eof_stdin(monkeypatch):
+    """Answer the buy prompt with EOF, as piped input would, even when output is captured"""
+    monkeypatch.setattr("sys.stdin", io.StringIO(""))
+
+def _players_by_name(state):
+    """Index the player entries of a get_game_state result by name"""
+    return {p["name"]: p for p in state["players"]}
 
 def test_unit_functionality():
     """Test individual MCP tool functions"""
     print("🧪 UNIT TESTS - Individual MCP Tool Functions")
     print("-" * 55)
     
-    # Import functions directly from the module
-    import mcp_server
-    
     # Test create_game
     print("  Testing create_game function...")
     
@@ -65,6 +85,9 @@ def test_unit_functionality():
     assert len(turn_result["dice"]) == 2, "Should have 2 dice"
     assert all(1 <= d <= 6 for d in turn_result["dice"]), "Invalid dice values"
     
+    next_state = mcp_server.get_game_state.fn(game_id)
+    assert turn_result["next_player"] == next_state["current_player"], "next_player does not match game state"
+    
     print("    ✅ play_turn works correctly")
     
     # Test board info
@@ -74,6 +97,20 @@ def test_unit_functionality():
     assert "board_spaces" in board_info, "Missing board_spaces"
     assert board_info["total_spaces"] == 40, "Should have 40 spaces"
     
+    # The precomputed layout describes the same board a game builds
+    for space_info, space in zip(board_info["board_spaces"], mcp_server.active_games[game_id].board_spaces):
+        assert (space_info["name"], space_info["type"]) == (space.name, space.space_type.name), f"Space mismatch: {space_info}"
+        if space.property:
+            prop = space.property
+            expected = {"color": prop.color.name, "price": prop.price, "rent_base": prop.rent_base, "house_cost": prop.house_cost}
+            assert space_info["property"] == expected, f"Property terms mismatch: {space_info}"
+        else:
+            assert "property" not in space_info, f"Unexpected property terms: {space_info}"
+    
+    # Each call returns its own copy of the cached layout
+    board_info["board_spaces"].clear()
+    assert len(mcp_server.get_board_info.fn()["board_spaces"]) == 40, "Board info shared between calls"
+    
     print("    ✅ get_board_info works correctly")
     
     # Test list_active_games
@@ -92,8 +129,6 @@ def test_integration_scenarios():
     print("\n🔗 INTEGRATION TESTS - Complete Game Scenarios")
     print("-" * 55)
     
-    import mcp_server
-    
     # Test complete game workflow
     print("  Testing complete game workflow...")
     
@@ -117,9 +152,8 @@ def test_integration_scenarios():
         
         # Play turn
         turn_result = mcp_server.play_turn.fn(game_id, current_player, "roll")
-        if "error" in turn_result:
-            continue
-            
+        assert "error" not in turn_result, f"Turn failed: {turn_result['error']}"
+        
         turns_played += 1
         
         # Handle property landings
@@ -127,14 +161,14 @@ def test_integration_scenarios():
             landed_space = turn_result["landed_on"]
             
             # Simple AI: buy if we have money
-            player_money = next(p["money"] for p in state["players"] if p["name"] == current_player)
+            player_money = _players_by_name(state)[current_player]["money"]
             
             if player_money > 400:  # Keep some cash buffer
                 buy_result = mcp_server.buy_property.fn(game_id, current_player, landed_space)
                 if "success" in buy_result and buy_result["success"]:
                     properties_acquired += 1
                     print(f"    Turn {turns_played}: {current_player} bought {landed_space}")
-                elif "error" in buy_result and "not a property" not in buy_result["error"]:
+                elif "error" in buy_result:
                     # Decline and trigger auction
                     decline_result = mcp_server.decline_property.fn(game_id, current_player)
                     if "auction_held" in decline_result:
@@ -158,10 +192,12 @@ def test_integration_scenarios():
     games_list = mcp_server.list_active_games.fn()
     assert games_list["total_games"] >= 3, f"Should have 3+ games, got {games_list['total_games']}"
     
-    # Verify all games are accessible
+    # Verify all games are accessible, keeping each state for the checks below
+    states = {}
     for game_info in games_list["active_games"]:
         state = mcp_server.get_game_state.fn(game_info["game_id"])
         assert "error" not in state, f"Game {game_info['game_id']} not accessible"
+        states[game_info["game_id"]] = state
     
     print("    ✅ Multi-game management works")
     
@@ -170,11 +206,10 @@ def test_integration_scenarios():
     
     # Find a player with properties
     all_players_props = []
-    for game_info in games_list["active_games"]:
-        state = mcp_server.get_game_state.fn(game_info["game_id"])
+    for game_id, state in states.items():
         for player in state["players"]:
             if len(player["properties"]) > 0:
-                props = mcp_server.get_player_properties.fn(game_info["game_id"], player["name"])
+                props = mcp_server.get_player_properties.fn(game_id, player["name"])
                 assert "error" not in props, f"Error getting properties: {props}"
                 assert props["total_properties"] == len(player["properties"]), "Property count mismatch"
                 all_players_props.append((player["name"], len(player["properties"])))
@@ -184,33 +219,38 @@ def test_integration_scenarios():
     
     print("✅ All integration tests passed!")
 
+# Tool calls that take a game ID, with the arguments that follow it
+_GAME_ID_CALLS = [
+    ("get_game_state", ()),
+    ("play_turn", ("FakePlayer", "roll")),
+    ("buy_property", ("FakePlayer", "Boardwalk")),
+    ("get_player_properties", ("FakePlayer",)),
+]
+
+# Player lists create_game must reject: too few or too many players
+_INVALID_ROSTERS = [[], ["OnlyOne"], [f"Player{i}" for i in range(10)]]
+
+@pytest.mark.parametrize("tool_name,args", _GAME_ID_CALLS)
+def test_unknown_game_id(tool_name, args):
+    """Test that a tool rejects a game ID that does not exist"""
+    result = getattr(mcp_server, tool_name).fn("nonexistent_game_12345", *args)
+    assert "error" in result, f"{tool_name} should fail with fake ID"
+    
+    print(f"    ✅ {tool_name} rejects unknown game IDs")
+
+@pytest.mark.parametrize("player_names", _INVALID_ROSTERS)
+def test_invalid_game_creation(player_names):
+    """Test that create_game rejects an invalid number of players"""
+    result = mcp_server.create_game.fn(player_names)
+    assert "error" in result, f"Should error with {len(player_names)} players"
+    
+    print(f"    ✅ create_game rejects {len(player_names)} player(s)")
+
 def test_error_handling():
     """Test error handling and edge cases"""
     print("\n🚨 ERROR HANDLING TESTS - Edge Cases and Invalid Operations")
     print("-" * 55)
     
-    import mcp_server
-    
-    # Test invalid game operations
-    print("  Testing invalid game operations...")
-    
-    fake_game_id = "nonexistent_game_12345"
-    
-    # All operations with fake game should fail
-    state_result = mcp_server.get_game_state.fn(fake_game_id)
-    assert "error" in state_result, "get_game_state should fail with fake ID"
-    
-    turn_result = mcp_server.play_turn.fn(fake_game_id, "FakePlayer", "roll")
-    assert "error" in turn_result, "play_turn should fail with fake ID"
-    
-    buy_result = mcp_server.buy_property.fn(fake_game_id, "FakePlayer", "Boardwalk")
-    assert "error" in buy_result, "buy_property should fail with fake ID"
-    
-    props_result = mcp_server.get_player_properties.fn(fake_game_id, "FakePlayer")
-    assert "error" in props_result, "get_player_properties should fail with fake ID"
-    
-    print("    ✅ Invalid game operations handled correctly")
-    
     # Test wrong player turn
     print("  Testing wrong player turn handling...")
     
@@ -227,22 +267,6 @@ def test_error_handling():
     
     print("    ✅ Wrong turn handling works correctly")
     
-    # Test invalid game creation
-    print("  Testing invalid game creation...")
-    
-    # Too few players
-    result1 = mcp_server.create_game.fn([])
-    assert "error" in result1, "Should error with no players"
-    
-    result2 = mcp_server.create_game.fn(["OnlyOne"])
-    assert "error" in result2, "Should error with one player"
-    
-    # Too many players
-    result3 = mcp_server.create_game.fn([f"Player{i}" for i in range(10)])
-    assert "error" in result3, "Should error with 10 players"
-    
-    print("    ✅ Invalid game creation handled correctly")
-    
     print("✅ All error handling tests passed!")
 
 def test_game_invariants():
@@ -250,8 +274,6 @@ def test_game_invariants():
     print("\n🔬 PROPERTY-BASED TESTS - Game Invariants")
     print("-" * 55)
     
-    import mcp_server
-    
     # Test position validity
     print("  Testing position validity invariant...")
     
@@ -326,20 +348,17 @@ def run_performance_check():
     print("\n⚡ PERFORMANCE CHECK - Basic Speed Test")
     print("-" * 55)
     
-    import mcp_server
-    import time
-    
     # Test game creation speed
     print("  Testing game creation performance...")
     
-    start_time = time.time()
+    start_time = time.perf_counter()
     
     # Create multiple games quickly
     for i in range(10):
         mcp_server.create_game.fn([f"PerfTest{i}_1", f"PerfTest{i}_2"])
     
-    creation_time = time.time() - start_time
-    print(f"    Created 10 games in {creation_time:.3f} seconds ({creation_time/10:.3f}s per game)")
+    creation_time = time.perf_counter() - start_time
+    print(f"    Created 10 games in {creation_time:.3f} seconds ({creation_time/10*1000:.2f}ms per game)")
     
     # Test turn execution speed
     print("  Testing turn execution performance...")
@@ -348,24 +367,25 @@ def run_performance_check():
     games = mcp_server.list_active_games.fn()
     test_game_id = games["active_games"][0]["game_id"]
     
-    start_time = time.time()
+    start_time = time.perf_counter()
     turns_completed = 0
     
+    # play_turn reports who plays next, so the state is only fetched once
+    current_player = mcp_server.get_game_state.fn(test_game_id)["current_player"]
+    
     for turn in range(50):
-        state = mcp_server.get_game_state.fn(test_game_id)
-        if state["game_over"]:
-            break
-        
-        current_player = state["current_player"]
         turn_result = mcp_server.play_turn.fn(test_game_id, current_player, "roll")
         
         if "error" not in turn_result:
             turns_completed += 1
+            current_player = turn_result["next_player"]
+            if turn_result.get("game_over"):
+                break
     
-    execution_time = time.time() - start_time
+    execution_time = time.perf_counter() - start_time
     
     if turns_completed > 0:
-        print(f"    Executed {turns_completed} turns in {execution_time:.3f} seconds ({execution_time/turns_completed:.3f}s per turn)")
+        print(f"    Executed {turns_completed} turns in {execution_time:.3f} seconds ({execution_time/turns_completed*1000:.2f}ms per turn)")
     else:
         print("    No turns completed (game may have ended quickly)")
     
@@ -377,15 +397,17 @@ def main():
     print("=" * 65)
     
     try:
-        # Reset environment for clean testing
-        reset_test_environment()
+        # Run all test suites, each against a clean environment
+        for suite in (test_unit_functionality, test_integration_scenarios,
+                      test_error_handling, test_game_invariants, run_performance_check):
+            reset_test_environment()
+            suite()
         
-        # Run all test suites
-        test_unit_functionality()
-        test_integration_scenarios()
-        test_error_handling()
-        test_game_invariants()
-        run_performance_check()
+        # Run the parametrized error cases
+        for tool_name, args in _GAME_ID_CALLS:
+            test_unknown_game_id(tool_name, args)
+        for player_names in _INVALID_ROSTERS:
+            test_invalid_game_creation(player_names)
         
         print("\n" + "=" * 65)
         print("🎉 ALL MCP FUNCTIONS VERIFICATION COMPLETE!")
@@ -5,8 +5,10 @@ Test script for the Monopoly MCP Server
 This script tests the MCP server functionality to ensure AI agents can play Monopoly.
 """
 
-import json
-from typing import Dict, Any
+import random
+
+# Fixed seed so the simulated game rolls the same dice on every run
+_SEED = 7
 
 def test_mcp_server_import():
     """Test that the MCP server can be imported and initialized"""
@@ -58,6 +60,8 @@ def test_game_simulation():
     from main import MonopolyGame
     from mcp_server import active_games, game_counter
     
+    random.seed(_SEED)
+    
     # Test 1: Create a game using the same logic as the MCP tool
     print("\n1. Creating a game...")
     global game_counter
@@ -6,53 +6,67 @@ This test suite directly tests the MCP tool functions without async complication
 providing comprehensive verification of the Monopoly MCP server implementation.
 """
 
+import random
 import sys
 import traceback
-from typing import Dict, List, Any
+from operator import itemgetter
+
+import mcp_server
+
+# The tools under test, mapped to their underlying functions
+_TOOL_NAMES = ('create_game', 'get_game_state', 'play_turn', 'buy_property',
+               'decline_property', 'get_player_properties', 'list_active_games', 'get_board_info')
+_TOOLS = {name: getattr(mcp_server, name).fn for name in _TOOL_NAMES}
+
+# Tool calls that take a game ID, with the arguments that follow it
+_UNKNOWN_GAME_CALLS = (
+    ("get_game_state", ()),
+    ("play_turn", ("FakePlayer", "roll")),
+    ("buy_property", ("FakePlayer", "Boardwalk")),
+    ("decline_property", ("FakePlayer",)),
+    ("get_player_properties", ("FakePlayer",)),
+)
+
+# Tool calls that take a game ID and player, with the arguments that follow them
+_UNKNOWN_PLAYER_CALLS = (
+    ("play_turn", ("roll",)),
+    ("buy_property", ("Boardwalk",)),
+    ("decline_property", ()),
+    ("get_player_properties", ()),
+)
+
+# Reads a player's money from a get_game_state player entry
+_get_money = itemgetter("money")
+
+# Seed for the purchase flow game, whose first roll lands on a buyable property
+_PURCHASE_SEED = 42
 
 def reset_test_environment():
     """Reset the test environment for clean testing"""
-    import mcp_server
     mcp_server.active_games.clear()
     mcp_server.game_counter = 0
 
 class MCPToolTester:
     """Direct testing of MCP tool functions"""
     
+    __slots__ = ("tools", *_TOOL_NAMES)
+    
     def __init__(self):
-        # Import the MCP server and extract the actual functions from the tools
-        from mcp_server import mcp
-        
-        # Get the underlying functions from the registered tools
-        self.tools = {}
-        for tool_name in ['create_game', 'get_game_state', 'play_turn', 'buy_property',
-                         'decline_property', 'get_player_properties', 'list_active_games', 'get_board_info']:
-            # Find the tool by iterating through the tools (since get_tools is async)
-            found = False
-            try:
-                # Try to access the tool manager directly
-                tool_manager = mcp._tool_manager
-                if hasattr(tool_manager, 'tools'):
-                    for tool in tool_manager.tools:
-                        if tool.name == tool_name:
-                            self.tools[tool_name] = tool.fn
-                            found = True
-                            break
-                
-                if not found:
-                    # Fallback: import the function directly from the module
-                    import mcp_server
-                    self.tools[tool_name] = getattr(mcp_server, tool_name)
-            except:
-                # Last resort: import directly from module
-                import mcp_server
-                self.tools[tool_name] = getattr(mcp_server, tool_name)
+        self.tools = _TOOLS
+        
+        # Bind each tool as an attribute so self.play_turn(...) is a plain lookup
+        for name, fn in _TOOLS.items():
+            setattr(self, name, fn)
     
-    def __getattr__(self, name):
-        """Delegate tool calls to the actual functions"""
-        if name in self.tools:
-            return self.tools[name]
-        raise AttributeError(f"Tool {name} not found")
+    def _play_and_snapshot(self, game_id, player_name):
+        """Roll for a player, returning the turn result and the game state after it"""
+        turn_result = self.play_turn(game_id, player_name, "roll")
+        return turn_result, self.get_game_state(game_id)
+    
+    @staticmethod
+    def _by_name(state):
+        """Index the player entries of a get_game_state result by name"""
+        return {p["name"]: p for p in state["players"]}
     
     def run_unit_tests(self):
         """Run unit tests for individual MCP tools"""
@@ -190,11 +204,12 @@ class MCPToolTester:
         
         # Verify state changed appropriately
         final_state = self.get_game_state(game_id)
-        final_player_data = next(p for p in final_state["players"] if p["name"] == current_player)
+        final_player_data = self._by_name(final_state)[current_player]
         
-        # Player should have moved (unless sent to jail or something special)
+        # Player should have moved (unless sent to jail); a card can bring them
+        # back to where they started, so check the move rather than the position
         if not final_player_data["in_jail"]:
-            assert "position_change" in turn_result or "new_position" in turn_result, "Position should have changed"
+            assert "landed_on" in turn_result, "Player should have moved"
         
         print("    ✅ Complete turn sequence works")
         
@@ -202,19 +217,19 @@ class MCPToolTester:
         """Test property purchase workflow"""
         print("  Testing property purchase flow...")
         
+        # Seed the dice so the flow does not depend on earlier tests' rolls
+        random.seed(_PURCHASE_SEED)
+        
         # Create game
-        game_result = self.create_game(["PropBuyPlayer"])
+        game_result = self.create_game(["PropBuyPlayer1", "PropBuyPlayer2"])
         game_id = game_result["game_id"]
         
+        # Each roll reports who plays next, so only the first player needs a state fetch
+        current_player = self.get_game_state(game_id)["current_player"]
+        
         # Try to find a property to land on by playing turns
         property_found = False
         for attempt in range(30):  # Try up to 30 turns
-            state = self.get_game_state(game_id)
-            if state["game_over"]:
-                break
-                
-            current_player = state["current_player"]
-            
             # Play turn
             turn_result = self.play_turn(game_id, current_player, "roll")
             if "error" in turn_result:
@@ -233,7 +248,7 @@ class MCPToolTester:
                     
                     # Verify property is in player's inventory
                     updated_state = self.get_game_state(game_id)
-                    player_data = next(p for p in updated_state["players"] if p["name"] == current_player)
+                    player_data = self._by_name(updated_state)[current_player]
                     assert landed_space in player_data["properties"], "Property not in inventory"
                     
                     # Test get_player_properties
@@ -250,6 +265,10 @@ class MCPToolTester:
                         print(f"    Property {landed_space} went to auction")
                         property_found = True
                         break
+            
+            if turn_result.get("game_over"):
+                break
+            current_player = turn_result["next_player"]
         
         if property_found:
             print("    ✅ Property purchase flow works")
@@ -267,8 +286,9 @@ class MCPToolTester:
         # Play several rounds and verify turn rotation
         players_who_played = set()
         
+        # Each turn's resulting state is the next turn's starting state
+        state = self.get_game_state(game_id)
         for turn in range(12):  # 4 turns per player
-            state = self.get_game_state(game_id)
             if state["game_over"]:
                 break
                 
@@ -276,15 +296,14 @@ class MCPToolTester:
             players_who_played.add(current_player)
             
             # Play turn
-            turn_result = self.play_turn(game_id, current_player, "roll")
+            turn_result, state = self._play_and_snapshot(game_id, current_player)
             if "error" in turn_result:
                 continue
                 
             # Verify turn rotation (unless doubles were rolled)
             if "doubles" not in turn_result or not turn_result["doubles"]:
-                next_state = self.get_game_state(game_id)
-                if not next_state["game_over"]:
-                    next_player = next_state["current_player"]
+                if not state["game_over"]:
+                    next_player = state["current_player"]
                     assert next_player != current_player or turn_result.get("extra_turn", False), "Turn should have rotated"
         
         # All players should have had a chance to play
@@ -301,15 +320,14 @@ class MCPToolTester:
         game_id = game_result["game_id"]
         
         # Track game progression
-        initial_state = self.get_game_state(game_id)
-        initial_money = sum(p["money"] for p in initial_state["players"])
+        state = self.get_game_state(game_id)
+        initial_money = sum(map(_get_money, state["players"]))
         
         turns_played = 0
         properties_acquired = 0
         
         # Play for a while
         for turn in range(25):
-            state = self.get_game_state(game_id)
             if state["game_over"]:
                 break
                 
@@ -325,17 +343,23 @@ class MCPToolTester:
                     buy_result = self.buy_property(game_id, current_player, turn_result["landed_on"])
                     if "success" in buy_result and buy_result["success"]:
                         properties_acquired += 1
+            
+            # Fetch after any purchase so the next turn sees it
+            state = self.get_game_state(game_id)
         
         # Verify progression
-        final_state = self.get_game_state(game_id)
-        final_money = sum(p["money"] for p in final_state["players"])
+        final_state = state
+        final_money = sum(map(_get_money, final_state["players"]))
         total_properties = sum(len(p["properties"]) for p in final_state["players"])
         
+        # Purchases, taxes and fees are paid to the bank, so the total may fall;
+        # only per-player solvency and the property count are invariant here
         assert turns_played > 0, "No turns were played"
-        assert final_money >= initial_money, "Total money decreased unexpectedly"
-        assert total_properties >= 0, "Properties count is negative"
+        assert all(money >= 0 for money in map(_get_money, final_state["players"])), "Player money went negative"
+        assert total_properties <= properties_acquired, "Properties owned that were never bought"
         
-        print(f"    Game progressed: {turns_played} turns, {total_properties} properties owned")
+        print(f"    Game progressed: {turns_played} turns, {total_properties} properties owned, "
+              f"total money ${initial_money} -> ${final_money}")
         print("    ✅ Game progression works")
     
     def run_error_handling_tests(self):
@@ -356,19 +380,11 @@ class MCPToolTester:
         fake_game_id = "this_game_does_not_exist"
         
         # All operations should fail gracefully
-        operations = [
-            ("get_game_state", (fake_game_id,)),
-            ("play_turn", (fake_game_id, "FakePlayer", "roll")),
-            ("buy_property", (fake_game_id, "FakePlayer", "Boardwalk")),
-            ("decline_property", (fake_game_id, "FakePlayer")),
-            ("get_player_properties", (fake_game_id, "FakePlayer"))
-        ]
-        
-        for op_name, args in operations:
+        for op_name, args in _UNKNOWN_GAME_CALLS:
             operation = getattr(self, op_name)
-            result = operation(*args)
+            result = operation(fake_game_id, *args)
             assert "error" in result, f"{op_name} should have failed with fake game"
-            assert "not found" in result["error"].lower(), f"Error message unclear for {op_name}: {result['error']}"
+            assert result["error"] == f"Game {fake_game_id} not found", f"Error message unclear for {op_name}: {result['error']}"
         
         print("    ✅ Nonexistent game operations handled correctly")
         
@@ -383,16 +399,9 @@ class MCPToolTester:
         fake_player = "NonExistentPlayer"
         
         # Operations with invalid player should fail
-        operations = [
-            ("play_turn", (game_id, fake_player, "roll")),
-            ("buy_property", (game_id, fake_player, "Boardwalk")),
-            ("decline_property", (game_id, fake_player)),
-            ("get_player_properties", (game_id, fake_player))
-        ]
-        
-        for op_name, args in operations:
+        for op_name, args in _UNKNOWN_PLAYER_CALLS:
             operation = getattr(self, op_name)
-            result = operation(*args)
+            result = operation(game_id, fake_player, *args)
             # Some operations might have different error handling, so we're flexible
             if "error" in result:
                 print(f"    {op_name} correctly rejected invalid player")
@@ -415,7 +424,7 @@ class MCPToolTester:
         # Try to play with wrong player
         result = self.play_turn(game_id, wrong_player, "roll")
         assert "error" in result, "Should error when wrong player tries to play"
-        assert "turn" in result["error"].lower(), f"Error message should mention turn: {result['error']}"
+        assert result["error"] == f"It's not {wrong_player}'s turn. Current player: {current_player}", f"Error message should mention turn: {result['error']}"
         
         print("    ✅ Wrong turn attempts handled correctly")
     
@@ -439,14 +448,14 @@ class MCPToolTester:
         game_id = game_result["game_id"]
         
         # Play turns and verify consistency
+        state = self.get_game_state(game_id)
         for turn in range(15):
-            state = self.get_game_state(game_id)
             if state["game_over"]:
                 break
             
             # Check basic invariants
             assert len(state["players"]) == 2, "Player count changed"
-            assert state["current_player"] in [p["name"] for p in state["players"]], "Invalid current player"
+            assert state["current_player"] in self._by_name(state), "Invalid current player"
             assert isinstance(state["houses_remaining"], int), "Houses remaining not int"
             assert isinstance(state["hotels_remaining"], int), "Hotels remaining not int"
             assert 0 <= state["houses_remaining"] <= 32, f"Invalid houses: {state['houses_remaining']}"
@@ -454,12 +463,9 @@ class MCPToolTester:
             
             current_player = state["current_player"]
             
-            # Play turn
-            self.play_turn(game_id, current_player, "roll")
-            
-            # Re-check consistency after turn
-            new_state = self.get_game_state(game_id)
-            assert len(new_state["players"]) == 2, "Player count changed during turn"
+            # Play turn and re-check consistency after it
+            _, state = self._play_and_snapshot(game_id, current_player)
+            assert len(state["players"]) == 2, "Player count changed during turn"
         
         print("    ✅ Game state consistency maintained")
         
@@ -468,7 +474,7 @@ class MCPToolTester:
         print("  Testing position validity...")
         
         # Create game
-        game_result = self.create_game(["PosTest"])
+        game_result = self.create_game(["PosTest1", "PosTest2"])
         game_id = game_result["game_id"]
         
         # Play many turns and check positions